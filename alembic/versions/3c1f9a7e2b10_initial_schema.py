@@ -0,0 +1,128 @@
+"""initial schema
+
+Revision ID: 3c1f9a7e2b10
+Revises: 
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f9a7e2b10'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('password', sa.String(), nullable=False),
+    sa.Column('role', sa.String(length=20), nullable=False),
+    sa.Column('cnpj', sa.String(length=20), nullable=True),
+    sa.Column('birthday', sa.String(), nullable=True),
+    sa.Column('cnh_number', sa.String(), nullable=True),
+    sa.Column('cnh_type', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('cnh_photo_path', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_cnpj'), 'users', ['cnpj'], unique=True)
+    op.create_index(op.f('ix_users_cnh_number'), 'users', ['cnh_number'], unique=True)
+
+    op.create_table('motorcycles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('vin', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_motorcycles_id'), 'motorcycles', ['id'], unique=False)
+    op.create_index(op.f('ix_motorcycles_vin'), 'motorcycles', ['vin'], unique=True)
+
+    op.create_table('rental_plans',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('days', sa.Integer(), nullable=False),
+    sa.Column('price_per_day', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('days')
+    )
+    op.create_index(op.f('ix_rental_plans_id'), 'rental_plans', ['id'], unique=False)
+
+    op.create_table('rentals',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('expected_end_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['motorcycle_id'], ['motorcycles.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_rentals_id'), 'rentals', ['id'], unique=False)
+
+    op.create_table('motorcycle_notifications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('vin', sa.String(), nullable=False),
+    sa.Column('received_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_motorcycle_notifications_id'), 'motorcycle_notifications', ['id'], unique=False)
+    op.create_index(op.f('ix_motorcycle_notifications_vin'), 'motorcycle_notifications', ['vin'], unique=True)
+
+    op.create_table('rate_limit_buckets',
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('tokens', sa.Float(), nullable=False),
+    sa.Column('allowed', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+    op.create_table('revoked_tokens',
+    sa.Column('jti', sa.String(length=64), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('jti')
+    )
+    op.create_index(op.f('ix_revoked_tokens_expires_at'), 'revoked_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_revoked_tokens_expires_at'), table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
+    op.drop_table('rate_limit_buckets')
+    op.drop_index(op.f('ix_motorcycle_notifications_vin'), table_name='motorcycle_notifications')
+    op.drop_index(op.f('ix_motorcycle_notifications_id'), table_name='motorcycle_notifications')
+    op.drop_table('motorcycle_notifications')
+    op.drop_index(op.f('ix_rentals_id'), table_name='rentals')
+    op.drop_table('rentals')
+    op.drop_index(op.f('ix_rental_plans_id'), table_name='rental_plans')
+    op.drop_table('rental_plans')
+    op.drop_index(op.f('ix_motorcycles_vin'), table_name='motorcycles')
+    op.drop_index(op.f('ix_motorcycles_id'), table_name='motorcycles')
+    op.drop_table('motorcycles')
+    op.drop_index(op.f('ix_users_cnh_number'), table_name='users')
+    op.drop_index(op.f('ix_users_cnpj'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_table('users')
@@ -0,0 +1,57 @@
+"""motorcycle availability state
+
+Revision ID: 5b7c0d3e8a42
+Revises: 8d2e4b6a9f31
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7c0d3e8a42'
+down_revision: Union[str, Sequence[str], None] = '8d2e4b6a9f31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('motorcycles', sa.Column('current_rental_id', sa.Integer(), nullable=True))
+    op.add_column('motorcycles', sa.Column('is_available', sa.Boolean(), server_default=sa.true(), nullable=False))
+    op.create_foreign_key('fk_motorcycles_current_rental_id', 'motorcycles', 'rentals', ['current_rental_id'], ['id'])
+
+    op.execute("""
+        UPDATE motorcycles
+        SET current_rental_id = active.id, is_available = false
+        FROM (
+            SELECT DISTINCT ON (motorcycle_id) motorcycle_id, id
+            FROM rentals
+            WHERE status = 'active'
+            ORDER BY motorcycle_id, id DESC
+        ) AS active
+        WHERE active.motorcycle_id = motorcycles.id
+    """)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_motorcycles_available', 'motorcycles', ['id'],
+            unique=False,
+            postgresql_where=sa.text('is_available'),
+            postgresql_include=['model', 'year', 'vin'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_motorcycles_available', table_name='motorcycles', postgresql_concurrently=True, if_exists=True)
+
+    op.drop_constraint('fk_motorcycles_current_rental_id', 'motorcycles', type_='foreignkey')
+    op.drop_column('motorcycles', 'is_available')
+    op.drop_column('motorcycles', 'current_rental_id')
@@ -0,0 +1,44 @@
+"""rental hot path indexes
+
+Revision ID: 8d2e4b6a9f31
+Revises: 3c1f9a7e2b10
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4b6a9f31'
+down_revision: Union[str, Sequence[str], None] = '3c1f9a7e2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_rentals_active_motorcycle_id', 'rentals', ['motorcycle_id'],
+            unique=False,
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_rentals_user_id_start_date', 'rentals', ['user_id', 'start_date'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_rentals_user_id_start_date', table_name='rentals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_rentals_active_motorcycle_id', table_name='rentals', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,46 @@
+"""unique active rental per motorcycle
+
+Revision ID: 9a4e6c1d7b53
+Revises: 5b7c0d3e8a42
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4e6c1d7b53'
+down_revision: Union[str, Sequence[str], None] = '5b7c0d3e8a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fails if a motorcycle already has two active rentals; finish the extra
+    # rental and run app.scripts.reconcile_availability before retrying.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_rentals_active_motorcycle_id', 'rentals', ['motorcycle_id'],
+            unique=True,
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_rentals_active_motorcycle_id', table_name='rentals', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_rentals_active_motorcycle_id', 'rentals', ['motorcycle_id'],
+            unique=False,
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('uq_rentals_active_motorcycle_id', table_name='rentals', postgresql_concurrently=True, if_exists=True)
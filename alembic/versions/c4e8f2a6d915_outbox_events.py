@@ -0,0 +1,39 @@
+"""outbox events
+
+Revision ID: c4e8f2a6d915
+Revises: 9a4e6c1d7b53
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8f2a6d915'
+down_revision: Union[str, Sequence[str], None] = '9a4e6c1d7b53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('outbox_events',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('topic', sa.String(length=255), nullable=False),
+    sa.Column('key', sa.String(length=255), nullable=True),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_outbox_events_pending', 'outbox_events', ['id'], unique=False, postgresql_where=sa.text('sent_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events', postgresql_where=sa.text('sent_at IS NULL'))
+    op.drop_table('outbox_events')
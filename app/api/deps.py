@@ -1,8 +1,23 @@
-from app.database import SessionLocal
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.replica import replica_router
+from app.core.unit_of_work import UnitOfWork
+from app.database import ReplicaSessionLocal
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_uow():
+    async with UnitOfWork() as uow:
+        yield uow
+
+def get_db(uow: UnitOfWork = Depends(get_uow)) -> AsyncSession:
+    # Every dependency in a request shares the request's unit of work.
+    return uow.session
+
+async def get_read_db(request: Request, uow: UnitOfWork = Depends(get_uow)):
+    # Read-only endpoints go to the replica when one is configured, caught up,
+    # and the client has not just written; otherwise to the primary.
+    if not replica_router.use_replica(request):
+        yield uow.session
+        return
+
+    async with ReplicaSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,11 +1,21 @@
-from fastapi import APIRouter, Depends, status 
-from sqlalchemy.orm import Session
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Path, UploadFile, status 
+from fastapi.responses import StreamingResponse
 from app.schemas.user import AdminCreate, UserResponse
 from app.schemas.response import SucessResponse
 from app.services.user_service import UserService
-from app.api.deps import get_db
-from app.core.auth import require_admin
-from app.models.user import User
+from app.services.rental_plan_service import RentalPlanService
+from app.schemas.rental_plan import RentalPlanResponse, RentalPlanUpdate
+from app.api.deps import get_uow
+from app.core.unit_of_work import UnitOfWork
+from app.core.auth import require_admin, Principal
+from app.core.metrics import collect_metrics
+from app.services.export_service import ExportService, ExportFormat, MEDIA_TYPES
+from app.services.motorcycle_import_service import MotorcycleImportService
+from app.services.user_import_service import UserImportService
+from app.services.import_file import parse_import_file
+from app.schemas.motorcycle import MotorcycleImportReport
 from app.schemas.error import ErrorResponse
 
 router = APIRouter(prefix = "/admin", tags = ["admin"])
@@ -19,13 +29,168 @@ router = APIRouter(prefix = "/admin", tags = ["admin"])
                 401: {"model": ErrorResponse, "description": "Unauthorized"},
                 403: {"model": ErrorResponse, "description": "Admin access required"},
                 409: {"model": ErrorResponse, "description": "Email already exists"},
+                503: {"model": ErrorResponse, "description": "Password hashing service busy"},
             })
-def create_admin(admin: AdminCreate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+async def create_admin(admin: AdminCreate, uow: UnitOfWork = Depends(get_uow), _: Principal = Depends(require_admin)):
     
-    new_admin = UserService.register_admin(db, admin)
+    new_admin = await UserService.register_admin(uow.session, admin)
+    await uow.commit()
 
     return SucessResponse(
         message = "Admin user created successfully.",
         data = UserResponse.model_validate(new_admin, from_attributes = True)
     )
 
+@router.put(
+            "/rental-plans/{days}",
+            status_code = status.HTTP_200_OK,
+            response_model = SucessResponse[RentalPlanResponse],
+            summary = "Create or update a rental plan",
+            description = """
+            Sets the daily price of the plan with the given number of days,
+            creating the plan if it does not exist. Every worker reloads its
+            rental plan catalog once the change is committed.
+
+            **Authorization:** Admin required.
+            """,
+            responses = {
+                403: {"model": ErrorResponse, "description": "Admin access required"},
+                422: {"model": ErrorResponse, "description": "Validation error (days must be greater than 0)"},
+            })
+async def set_rental_plan(data: RentalPlanUpdate, days: int = Path(gt = 0), uow: UnitOfWork = Depends(get_uow), _: Principal = Depends(require_admin)):
+
+    plan = await RentalPlanService.set_price(uow.session, days, data.price_per_day)
+    await uow.commit()
+
+    return SucessResponse(
+        message = "Rental plan saved successfully.",
+        data = RentalPlanResponse.model_validate(plan)
+    )
+
+@router.get(
+            "/metrics",
+            status_code = status.HTTP_200_OK,
+            response_model = SucessResponse[dict],
+            summary = "Runtime metrics",
+            description = """
+            Returns in-process runtime counters (caches, pools, limiters)
+            of the worker that served the request.
+
+            **Authorization:** Admin required.
+            """,
+            responses = {
+                401: {"model": ErrorResponse, "description": "Unauthorized"},
+                403: {"model": ErrorResponse, "description": "Admin access required"},
+            })
+async def get_metrics(_: Principal = Depends(require_admin)):
+
+    return SucessResponse(
+        message = "Metrics retrieved successfully.",
+        data = collect_metrics()
+    )
+
+@router.get(
+            "/exports/rentals",
+            status_code = status.HTTP_200_OK,
+            summary = "Export rentals",
+            description = """
+            Streams the full rental history as NDJSON or CSV.
+
+            Rows are read through a server-side cursor and written as they
+            arrive, so memory use does not grow with the size of the history.
+
+            **Query parameters:**
+            - **format**: ndjson (default) or csv
+            - **start_date_from** / **start_date_to**: optional inclusive range on start_date
+
+            **Authorization:** Admin required.
+            """,
+            responses = {
+                401: {"model": ErrorResponse, "description": "Unauthorized"},
+                403: {"model": ErrorResponse, "description": "Admin access required"},
+            })
+async def export_rentals(format: ExportFormat = ExportFormat.ndjson, start_date_from: Optional[date] = None, start_date_to: Optional[date] = None, _: Principal = Depends(require_admin)):
+
+    return StreamingResponse(
+        ExportService.stream_rentals(format, start_date_from, start_date_to),
+        media_type = MEDIA_TYPES[format],
+        headers = {"Content-Disposition": f"attachment; filename=rentals.{format.value}"}
+    )
+
+@router.get(
+            "/exports/motorcycles",
+            status_code = status.HTTP_200_OK,
+            summary = "Export motorcycles",
+            description = """
+            Streams every registered motorcycle as NDJSON or CSV.
+
+            **Authorization:** Admin required.
+            """,
+            responses = {
+                401: {"model": ErrorResponse, "description": "Unauthorized"},
+                403: {"model": ErrorResponse, "description": "Admin access required"},
+            })
+async def export_motorcycles(format: ExportFormat = ExportFormat.ndjson, _: Principal = Depends(require_admin)):
+
+    return StreamingResponse(
+        ExportService.stream_motorcycles(format),
+        media_type = MEDIA_TYPES[format],
+        headers = {"Content-Disposition": f"attachment; filename=motorcycles.{format.value}"}
+    )
+
+@router.post(
+            "/imports/motorcycles",
+            status_code = status.HTTP_200_OK,
+            response_model = SucessResponse[MotorcycleImportReport],
+            summary = "Bulk import motorcycles",
+            description = """
+            Registers every motorcycle in a CSV (header **model,year,vin**) or
+            NDJSON file in a single transaction. Invalid rows and VINs that
+            already exist are skipped and listed in the report with their row
+            number; every imported motorcycle publishes a **motorcycle.created** event.
+
+            **Authorization:** Admin required.
+            """,
+            responses = {
+                400: {"model": ErrorResponse, "description": "File is not UTF-8"},
+                403: {"model": ErrorResponse, "description": "Admin access required"},
+                413: {"model": ErrorResponse, "description": "Too many rows"},
+            })
+async def import_motorcycles(format: ExportFormat = ExportFormat.csv, file: UploadFile = File(...), uow: UnitOfWork = Depends(get_uow), _: Principal = Depends(require_admin)):
+
+    report = await MotorcycleImportService.import_motorcycles(uow.session, await file.read(), format)
+    await uow.commit()
+
+    return SucessResponse(
+        message = "Motorcycle import finished.",
+        data = report
+    )
+
+@router.post(
+            "/imports/users",
+            status_code = status.HTTP_200_OK,
+            summary = "Bulk import riders",
+            description = """
+            Registers every rider in a CSV or NDJSON file of **UserCreate**
+            records and streams back one NDJSON result per record, with its
+            row number and either the created id or an error code.
+
+            Records repeating an email, CNPJ or CNH number already seen in the
+            file are rejected before touching the database. Records are
+            committed in batches; a **created** result is already durable.
+
+            **Authorization:** Admin required.
+            """,
+            responses = {
+                400: {"model": ErrorResponse, "description": "File is not UTF-8"},
+                403: {"model": ErrorResponse, "description": "Admin access required"},
+                413: {"model": ErrorResponse, "description": "Too many rows"},
+            })
+async def import_users(format: ExportFormat = ExportFormat.ndjson, file: UploadFile = File(...), _: Principal = Depends(require_admin)):
+
+    records = parse_import_file(await file.read(), format)
+
+    return StreamingResponse(
+        UserImportService.import_users(records),
+        media_type = MEDIA_TYPES[ExportFormat.ndjson]
+    )
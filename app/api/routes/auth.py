@@ -1,24 +1,30 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from app.api.deps import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_db, get_uow
+from app.core.unit_of_work import UnitOfWork
 from app.schemas.auth import LoginRequest, LoginResponse, RefreshTokenRequest
 from app.services.auth_service import AuthService
 from app.schemas.response import SucessResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from jose import jwt
 from app.schemas.error import ErrorResponse
+from app.core.rate_limit import limit_auth_by_ip, login_email_limiter
 
-router = APIRouter(prefix = "/auth", tags = ["auth"])
+router = APIRouter(prefix = "/auth", tags = ["auth"], dependencies = [Depends(limit_auth_by_ip)])
 
 @router.post(
             "/login", 
             summary = "Login with OAuth2",
             responses = {
-                401: {"model": ErrorResponse, "description": "Invalid credentials"}
+                401: {"model": ErrorResponse, "description": "Invalid credentials"},
+                429: {"model": ErrorResponse, "description": "Too many login attempts"},
+                503: {"model": ErrorResponse, "description": "Authentication service busy"},
             })
-def login_oath2(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login_oath2(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
  
-    result = AuthService.login(db, form_data.username, form_data.password)
+    await login_email_limiter.hit(form_data.username.lower())
+
+    result = await AuthService.login(db, form_data.username, form_data.password)
 
     return {
         "access_token": result.tokens.access_token,
@@ -32,9 +38,13 @@ def login_oath2(form_data: OAuth2PasswordRequestForm = Depends(), db: Session =
             responses = {
                 401: {"model": ErrorResponse, "description": "Invalid credentials"},
                 404: {"model": ErrorResponse, "description": "User not found"},
+                429: {"model": ErrorResponse, "description": "Too many login attempts"},
+                503: {"model": ErrorResponse, "description": "Authentication service busy"},
             })
-def login_json(data: LoginRequest, db: Session = Depends(get_db)):
-    login_response = AuthService.login(db, data.email, data.password)
+async def login_json(data: LoginRequest, db: AsyncSession = Depends(get_db)):
+    await login_email_limiter.hit(data.email.lower())
+
+    login_response = await AuthService.login(db, data.email, data.password)
 
     return SucessResponse(
         message = "Login successful",
@@ -46,7 +56,29 @@ def login_json(data: LoginRequest, db: Session = Depends(get_db)):
             status_code=status.HTTP_200_OK,
             summary = "Refresh access token",
             responses = {
-                401: {"model": ErrorResponse, "description": "Invalid or expired refresh token"}
+                401: {"model": ErrorResponse, "description": "Invalid or expired refresh token"},
+                429: {"model": ErrorResponse, "description": "Too many requests"},
+            })
+async def refresh_token(data: RefreshTokenRequest, uow: UnitOfWork = Depends(get_uow)):
+    tokens = await AuthService.refresh_token(uow.session, data.refresh_token)
+    await uow.commit()
+
+    return tokens
+
+@router.post(
+            "/logout",
+            status_code = status.HTTP_200_OK,
+            response_model = SucessResponse[None],
+            summary = "Revoke a refresh token",
+            responses = {
+                401: {"model": ErrorResponse, "description": "Invalid, expired or already revoked refresh token"},
+                429: {"model": ErrorResponse, "description": "Too many requests"},
             })
-def refresh_token(data: RefreshTokenRequest, db: Session = Depends(get_db)):
-    return AuthService.refresh_token(db, data.refresh_token)
\ No newline at end of file
+async def logout(data: RefreshTokenRequest, uow: UnitOfWork = Depends(get_uow)):
+    await AuthService.logout(uow.session, data.refresh_token)
+    await uow.commit()
+
+    return SucessResponse(
+        message = "Logged out successfully.",
+        data = None
+    )
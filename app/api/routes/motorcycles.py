@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, status
-from app.core.auth import require_admin, get_current_user
-from sqlalchemy.orm import Session
-from app.api.deps import get_db
-from app.models.user import User
+from fastapi import APIRouter, Depends, Response, status
+from app.core.auth import require_admin, get_current_principal
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_db, get_read_db, get_uow
+from app.core.unit_of_work import UnitOfWork
+from app.core.auth import Principal
 from app.schemas.motorcycle import MotorcycleResponse, MotorcycleCreate, MotorcycleUpdate
 from app.services.motorcycle_service import MotorcycleService
 from app.schemas.response import SucessResponse
 from app.schemas.error import ErrorResponse
+from app.core.pagination import PageParams, page_params, paginate
 
 router = APIRouter(prefix = "/motorcycles", tags = ["motorcycles"]) 
 
@@ -28,9 +30,10 @@ router = APIRouter(prefix = "/motorcycles", tags = ["motorcycles"])
                 409: {"model": ErrorResponse, "description": "VIN already exists"},
                 422: {"model": ErrorResponse, "description": "Validation error"},
             })
-async def create_motorcycle(payload: MotorcycleCreate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+async def create_motorcycle(payload: MotorcycleCreate, uow: UnitOfWork = Depends(get_uow), _: Principal = Depends(require_admin)):
     
-    motorcycle = await MotorcycleService.register(db, payload)
+    motorcycle = await MotorcycleService.register(uow.session, payload)
+    await uow.commit()
 
     return SucessResponse(
         message="Motorcycle created successfully.",
@@ -43,7 +46,9 @@ async def create_motorcycle(payload: MotorcycleCreate, db: Session = Depends(get
             response_model = SucessResponse[list[MotorcycleResponse]],
             summary = "List all Motorcycles",
             description = """
-            Retrieves a list of all motorcycles registered in the system.
+            Retrieves a page of the motorcycles registered in the system,
+            ordered by id. Pass the returned **next_cursor** as **cursor**
+            to fetch the following page.
 
             This endpoint is restricted to **administrators only** and returns
             both available and rented motorcycles.
@@ -53,13 +58,14 @@ async def create_motorcycle(payload: MotorcycleCreate, db: Session = Depends(get
             responses = {
                 403: {"model": ErrorResponse, "description": "Admin access required"},
             })
-def get_motorcycles(db: Session = Depends(get_db), _: User = Depends(require_admin)):
+async def get_motorcycles(page: PageParams = Depends(page_params), db: AsyncSession = Depends(get_read_db), _: Principal = Depends(require_admin)):
 
-    motorcycles = MotorcycleService.list_all(db)
+    motorcycles, next_cursor = paginate(await MotorcycleService.list_all(db, page), page.limit)
 
     return SucessResponse(
         message = "Motorcycles retrieved successfully.",
-        data = [MotorcycleResponse.model_validate(m) for m in motorcycles]
+        data = [MotorcycleResponse.model_validate(m) for m in motorcycles],
+        next_cursor = next_cursor
     )
 
 @router.get(
@@ -71,7 +77,8 @@ def get_motorcycles(db: Session = Depends(get_db), _: User = Depends(require_adm
             Retrieves a list of motorcycles that are currently **available for rental**.
 
             Only motorcycles that are **not associated with an active rental**
-            will be returned.
+            will be returned. The response is served from a short-lived cache
+            that is invalidated whenever a rental or motorcycle changes.
 
             This endpoint is accessible to **authenticated users**.
 
@@ -81,13 +88,12 @@ def get_motorcycles(db: Session = Depends(get_db), _: User = Depends(require_adm
                 401: {"model": ErrorResponse, "description": "Not authenticated"},
                 403: {"model": ErrorResponse, "description": "Invalid credentials"},
             })
-def list_available_motorcycles(db: Session = Depends(get_db), _: User = Depends(get_current_user)):
-    motorcycles = MotorcycleService.list_available(db)
+async def list_available_motorcycles(db: AsyncSession = Depends(get_db), _: Principal = Depends(get_current_principal)):
+    # Stays on the primary: the cache is refilled right after a NOTIFY-driven
+    # invalidation, and a lagging replica would pin the stale list for a full TTL.
+    payload = await MotorcycleService.list_available_payload(db)
 
-    return SucessResponse(
-        message = "Available motorcycles retrieved successfully.",
-        data = [MotorcycleResponse.model_validate(m) for m in motorcycles]
-    )
+    return Response(content = payload, media_type = "application/json")
 
 @router.get(
             '/{vin}', 
@@ -108,9 +114,9 @@ def list_available_motorcycles(db: Session = Depends(get_db), _: User = Depends(
                 403: {"model": ErrorResponse, "description": "Admin access required"},
                 404: {"model": ErrorResponse, "description": "Motorcycle not found"},
             })
-def get_motorcycles_by_vin(vin: str, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+async def get_motorcycles_by_vin(vin: str, db: AsyncSession = Depends(get_read_db), _: Principal = Depends(require_admin)):
     
-    motorcycle = MotorcycleService.get_by_vin(db, vin)
+    motorcycle = await MotorcycleService.get_by_vin(db, vin)
 
     return SucessResponse(
         message = "Motorcycle retrieved successfully.",
@@ -138,9 +144,10 @@ def get_motorcycles_by_vin(vin: str, db: Session = Depends(get_db), _: User = De
                 404: {"model": ErrorResponse, "description": "Motorcycle not found"},
                 409: {"model": ErrorResponse, "description": "VIN already exists"},
             })
-def update_motorcycle_vin(motorcycle_id: int, payload: MotorcycleUpdate, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+async def update_motorcycle_vin(motorcycle_id: int, payload: MotorcycleUpdate, uow: UnitOfWork = Depends(get_uow), _: Principal = Depends(require_admin)):
 
-    motorcycle = MotorcycleService.update_vin(db, motorcycle_id, payload.vin)
+    motorcycle = await MotorcycleService.update_vin(uow.session, motorcycle_id, payload.vin)
+    await uow.commit()
 
     return SucessResponse(
         message = "Motorcycle VIN updated successfully.",
@@ -170,8 +177,9 @@ def update_motorcycle_vin(motorcycle_id: int, payload: MotorcycleUpdate, db: Ses
                 404: {"model": ErrorResponse, "description": "Motorcycle not found"},
                 409: {"model": ErrorResponse, "description": "Motorcycle has rental records"},
             })
-def  delete_motorcycle(motorcycle_id: int, db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    MotorcycleService.delete(db, motorcycle_id)
+async def delete_motorcycle(motorcycle_id: int, uow: UnitOfWork = Depends(get_uow), _: Principal = Depends(require_admin)):
+    await MotorcycleService.delete(uow.session, motorcycle_id)
+    await uow.commit()
 
     return SucessResponse(
         message = "Motorcycle removed successfully.",
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Request, Response, status
+from app.schemas.rental_plan import RentalPlanResponse
+from app.schemas.response import SucessResponse
+from app.services.rental_plan_service import RentalPlanService
+
+router = APIRouter(prefix = "/rental-plans", tags = ["rental-plans"])
+
+@router.get(
+            "/",
+            status_code = status.HTTP_200_OK,
+            response_model = SucessResponse[list[RentalPlanResponse]],
+            summary = "List rental plans",
+            description = """
+            Retrieves the rental plans offered, ordered by number of days.
+
+            The response carries an **ETag** that changes only when a plan
+            changes; send it back as **If-None-Match** to get a 304.
+            """,
+            responses = {
+                304: {"description": "Plans unchanged since the given ETag"},
+            })
+async def list_rental_plans(request: Request):
+    catalog = RentalPlanService.catalog()
+    etag = f'"{catalog.version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code = status.HTTP_304_NOT_MODIFIED, headers = headers)
+
+    return Response(content = catalog.payload, media_type = "application/json", headers = headers)
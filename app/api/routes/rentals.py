@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from app.api.deps import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_read_db, get_uow
+from app.core.unit_of_work import UnitOfWork
 from app.schemas.rental import RentalCreate, RentalResponse, RentalReturnRequest, RentalReturnResponse
 from app.services.rental_service import RentalService
-from app.core.auth import get_current_user
-from app.models.user import User
+from app.core.auth import Principal
 from app.schemas.response import SucessResponse
-from app.core.auth import get_current_user, require_admin
+from app.core.auth import get_current_principal, require_admin
 from app.schemas.error import ErrorResponse
+from app.core.pagination import PageParams, page_params, paginate
 
 router = APIRouter(prefix = "/rentals", tags = ["rentals"])
 
@@ -36,9 +37,10 @@ router = APIRouter(prefix = "/rentals", tags = ["rentals"])
                 409: {"model": ErrorResponse, "description": "Motorcycle unavailable or invalid rental state"},
                 422: {"model": ErrorResponse, "description": "Validation error"},
             })
-def create_rental(data: RentalCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_rental(data: RentalCreate, uow: UnitOfWork = Depends(get_uow), current_user: Principal = Depends(get_current_principal)):
     
-    created_rental = RentalService.register(db, current_user.id, data)
+    created_rental = await RentalService.register(uow.session, current_user.id, data)
+    await uow.commit()
 
     return SucessResponse(
         message = "Rental created successfully.",
@@ -51,7 +53,8 @@ def create_rental(data: RentalCreate, db: Session = Depends(get_db), current_use
             response_model = SucessResponse[list[RentalResponse]],
             summary = "List all rentals",
             description = """
-            Retrieves all rentals registered in the system.
+            Retrieves a page of the rentals registered in the system, ordered by id.
+            Pass the returned **next_cursor** as **cursor** to fetch the next page.
 
             This endpoint is intended for administrative and operational
             purposes, providing visibility over all rentals regardless
@@ -60,14 +63,16 @@ def create_rental(data: RentalCreate, db: Session = Depends(get_db), current_use
             **Authorization:** Admin required.
             """,
             responses = {
+                400: {"model": ErrorResponse, "description": "Invalid cursor"},
                 403: {"model": ErrorResponse, "description": "Admin access required"},
             })
-def list_all_rentals(db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    rentals = RentalService.list_all(db)
+async def list_all_rentals(page: PageParams = Depends(page_params), db: AsyncSession = Depends(get_read_db), _: Principal = Depends(require_admin)):
+    rentals, next_cursor = paginate(await RentalService.list_all(db, page), page.limit)
 
     return SucessResponse(
         message = "All rentals retrieved successfully.",
-        data = [RentalResponse.model_validate(r) for r in rentals]
+        data = [RentalResponse.model_validate(r) for r in rentals],
+        next_cursor = next_cursor
     )
 
 @router.get(
@@ -76,7 +81,7 @@ def list_all_rentals(db: Session = Depends(get_db), _: User = Depends(require_ad
             response_model = SucessResponse[list[RentalResponse]],
             summary = "List rentals by motorcycle",
             description = """
-            Retrieves all rentals associated with a specific motorcycle.
+            Retrieves a page of the rentals associated with a specific motorcycle.
 
             This endpoint allows administrators to track the rental history
             of a motorcycle.
@@ -90,12 +95,13 @@ def list_all_rentals(db: Session = Depends(get_db), _: User = Depends(require_ad
                 403: {"model": ErrorResponse, "description": "Admin access required"},
                 404: {"model": ErrorResponse, "description": "Motorcycle not found"},
             })
-def list_rentals_by_motorcycle(motorcycle_id: int, db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    rentals = RentalService.list_by_motorcycle(db, motorcycle_id)
+async def list_rentals_by_motorcycle(motorcycle_id: int, page: PageParams = Depends(page_params), db: AsyncSession = Depends(get_read_db), _: Principal = Depends(require_admin)):
+    rentals, next_cursor = paginate(await RentalService.list_by_motorcycle(db, motorcycle_id, page), page.limit)
 
     return SucessResponse(
         message = "Rentals for motorcycle retrieved successfully.",
-        data = [RentalResponse.model_validate(r) for r in rentals]
+        data = [RentalResponse.model_validate(r) for r in rentals],
+        next_cursor = next_cursor
     )
 
 @router.get(
@@ -104,7 +110,7 @@ def list_rentals_by_motorcycle(motorcycle_id: int, db: Session = Depends(get_db)
             response_model = SucessResponse[list[RentalResponse]],
             summary = "List my rentals",
             description = """
-            Retrieves all rentals associated with the authenticated user.
+            Retrieves a page of the rentals associated with the authenticated user.
 
             This endpoint returns both active and completed rentals,
             allowing users to view their rental history.
@@ -114,12 +120,13 @@ def list_rentals_by_motorcycle(motorcycle_id: int, db: Session = Depends(get_db)
             responses = {
                 401: {"model": ErrorResponse, "description": "Not authenticated"},
             })
-def list_my_rentals(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    rentals = RentalService.list_by_user(db, current_user.id)
+async def list_my_rentals(page: PageParams = Depends(page_params), db: AsyncSession = Depends(get_read_db), current_user: Principal = Depends(get_current_principal)):
+    rentals, next_cursor = paginate(await RentalService.list_by_user(db, current_user.id, page), page.limit)
 
     return SucessResponse(
         message = "User rentals retrieved successfully.",
-        data = [RentalResponse.model_validate(r) for r in rentals]
+        data = [RentalResponse.model_validate(r) for r in rentals],
+        next_cursor = next_cursor
     )
     
 @router.post(
@@ -144,8 +151,9 @@ def list_my_rentals(db: Session = Depends(get_db), current_user: User = Depends(
                 409: {"model": ErrorResponse, "description": "Rental already returned"},
                 422: {"model": ErrorResponse, "description": "Validation error"},
             })
-def calculate_return(rental_id: int, data: RentalReturnRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = RentalService.return_rental(db, rental_id, current_user.id, data.return_date)
+async def calculate_return(rental_id: int, data: RentalReturnRequest, uow: UnitOfWork = Depends(get_uow), current_user: Principal = Depends(get_current_principal)):
+    result = await RentalService.return_rental(uow.session, rental_id, current_user.id, data.return_date)
+    await uow.commit()
 
     return SucessResponse(
         message = "Rental amount calculated successfully.",
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
-from app.core.auth import get_current_user, require_admin
-from app.models.user import User
+from app.core.auth import Principal, get_current_user, require_admin
+from app.core.user_cache import CachedUser
 
 router = APIRouter(prefix = "/test", tags = ["test"])
 
@@ -11,7 +11,7 @@ def public_route():
     }
 
 @router.get("/private")
-def private_route(current_user: User = Depends(get_current_user)):
+def private_route(current_user: CachedUser = Depends(get_current_user)):
     return {
         "message": "This is  protected route. Authentication successful.",
         "user_id": current_user.id,
@@ -19,7 +19,7 @@ def private_route(current_user: User = Depends(get_current_user)):
     }   
 
 @router.get("/admin")
-def admin_route(current_user: User = Depends(require_admin)):
+def admin_route(current_user: CachedUser = Depends(get_current_user), _: Principal = Depends(require_admin)):
     return {
         "message": "This is an admin-only route. Admin authentication successful.",
         "user_id": current_user.id,
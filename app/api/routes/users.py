@@ -1,12 +1,11 @@
 from fastapi import APIRouter, Depends, status, UploadFile, File
-from sqlalchemy.orm import Session
 from app.schemas.user import UserCreate, UserResponse
 from app.schemas.response import SucessResponse
 from app.services.user_service import UserService
-from app.api.deps import get_db
+from app.api.deps import get_uow
+from app.core.unit_of_work import UnitOfWork
 from app.schemas.error import ErrorResponse
-from app.models.user import User
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_principal
 
 router = APIRouter(prefix = "/users", tags = ["users"])
 
@@ -16,11 +15,13 @@ router = APIRouter(prefix = "/users", tags = ["users"])
         response_model = SucessResponse[UserResponse],
         responses = {
             400: {"model": ErrorResponse, "description": "Invalid data"}, 
-            409: {"model": ErrorResponse, "description": "User already exists"},
+            409: {"model": ErrorResponse, "description": "Email, CNPJ or CNH number already registered"},
+            503: {"model": ErrorResponse, "description": "Password hashing service busy"},
             500: {"model": ErrorResponse, "description": "Internal server error"}
         })
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
-    created_user = UserService.register_user(db, user)
+async def create_user(user: UserCreate, uow: UnitOfWork = Depends(get_uow)):
+    created_user = await UserService.register_user(uow.session, user)
+    await uow.commit()
 
     return SucessResponse(
         message = "User created successfully.",
@@ -36,13 +37,14 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
                 406: {"model": ErrorResponse},
                 500: {"model": ErrorResponse},
             })
-def upload_cnh_photo(file: UploadFile = File(...), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def upload_cnh_photo(file: UploadFile = File(...), uow: UnitOfWork = Depends(get_uow), current_user: Principal = Depends(get_current_principal)):
     
-    update_user = UserService.upload_cnh_photo(
-        db = db, 
-        user = current_user,
+    update_user = await UserService.upload_cnh_photo(
+        db = uow.session, 
+        user_id = current_user.id,
         file = file
     ) 
+    await uow.commit()
 
     return SucessResponse(
         message = "CNH photo uploaded successfully.",
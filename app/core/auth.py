@@ -1,16 +1,22 @@
+from dataclasses import dataclass
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import jwt, JWTError
 from app.core.jwt import decode_token
 from app.api.deps import get_db
-from app.models.user import User
 from app.core.exceptions import AppException
-from app.repositories.user_repository import UserRepository
+from app.core.user_cache import CachedUser
+from app.services.user_service import UserService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl = "/auth/login")
 
-def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
+@dataclass(frozen = True)
+class Principal:
+    id: int
+    role: str
+
+def get_current_principal(token: str = Depends(oauth2_scheme)) -> Principal:
 
     try:
         payload = decode_token(token)
@@ -26,7 +32,7 @@ def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_
             message = "Access token required.",
             status_code = status.HTTP_401_UNAUTHORIZED
         )
-    
+
     user_id = payload.get("sub")
 
     if not user_id:
@@ -36,7 +42,11 @@ def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_
             status_code=status.HTTP_401_UNAUTHORIZED
         )
 
-    user = UserRepository.get_by_id(db, int(user_id))
+    return Principal(id = int(user_id), role = payload.get("role"))
+
+async def get_current_user(principal: Principal = Depends(get_current_principal), db: AsyncSession = Depends(get_db)) -> CachedUser:
+
+    user = await UserService.get_cached(db, principal.id)
 
     if not user:
         raise AppException(
@@ -44,9 +54,10 @@ def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_
             message = "User not found.",
             status_code = status.HTTP_401_UNAUTHORIZED
         )
+
     return user
-    
-def require_access_token(token_data: dict): 
+
+def require_access_token(token_data: dict):
     if token_data.get("type") != "access":
         raise HTTPException(
             status_code = status.HTTP_401_UNAUTHORIZED,
@@ -54,12 +65,12 @@ def require_access_token(token_data: dict):
         )
 
 
-def require_admin(user: User = Depends(get_current_user)) -> User:
-    if user.role != "admin":
+def require_admin(principal: Principal = Depends(get_current_principal)) -> Principal:
+    if principal.role != "admin":
         raise AppException(
-            error = "FORBIDDEN", 
+            error = "FORBIDDEN",
             message = "Admin access required.",
             status_code = status.HTTP_403_FORBIDDEN
         )
 
-    return user
\ No newline at end of file
+    return principal
@@ -1,7 +1,18 @@
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DATABASE_REPLICA_URL: Optional[str] = None
+    REPLICA_MAX_LAG_SECONDS: float = 5
+    REPLICA_LAG_PROBE_INTERVAL_SECONDS: float = 2
+    READ_YOUR_WRITES_SECONDS: int = 10
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    SQL_N_PLUS_ONE_DETECTION: bool = False
+    SQL_N_PLUS_ONE_THRESHOLD: int = 3
 
     SECRET_KEY: str
 
@@ -19,6 +30,61 @@ class Settings(BaseSettings):
     KAFKA_BOOTSTRAP_SERVERS: str
     KAFKA_MOTORCYCLE_TOPIC: str
     KAFKA_CONSUMER_GROUP: str
+    KAFKA_MOTORCYCLE_TOPIC_PARTITIONS: int = 6
+    KAFKA_MOTORCYCLE_TOPIC_REPLICATION_FACTOR: int = 1
+    # "delete", "compact" or "compact,delete"; events are keyed by motorcycle_id.
+    KAFKA_MOTORCYCLE_TOPIC_CLEANUP_POLICY: str = "delete"
+    KAFKA_MOTORCYCLE_TOPIC_RETENTION_MS: int = 7 * 24 * 60 * 60 * 1000
+
+    KAFKA_PRODUCER_MODE: str = "fire_and_forget"
+    KAFKA_LINGER_MS: int = 10
+    KAFKA_MAX_BATCH_SIZE: int = 65536
+    KAFKA_COMPRESSION_TYPE: Optional[str] = "gzip"
+    KAFKA_SEND_BUFFER_SIZE: int = 10000
+    KAFKA_SEND_BUFFER_TIMEOUT_SECONDS: float = 5
+    # "msgpack" or "json"; consumers accept both, by the content-type header.
+    KAFKA_EVENT_ENCODING: str = "msgpack"
+
+    KAFKA_CONSUMER_BATCH_SIZE: int = 500
+    KAFKA_CONSUMER_BATCH_TIMEOUT_SECONDS: float = 1.0
+    KAFKA_CONSUMER_RETRY_DELAY_SECONDS: float = 3
+
+    OUTBOX_RELAY_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 5
+    # Sent events are kept this long (for inspection/replay), then purged.
+    OUTBOX_RETENTION_SECONDS: int = 24 * 60 * 60
+    OUTBOX_PURGE_INTERVAL_SECONDS: float = 300
+    OUTBOX_PURGE_BATCH_SIZE: int = 10000
+
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 300
+
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+    BULK_PASSWORD_HASH_WORKERS: Optional[int] = None
+    BULK_PASSWORD_HASH_CHUNK_SIZE: int = 16
+
+    JWT_VERIFIED_CACHE_MAX_SIZE: int = 50000
+
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_AUTH_IP_CAPACITY: int = 20
+    RATE_LIMIT_AUTH_IP_REFILL_PER_SECOND: float = 0.5
+    RATE_LIMIT_LOGIN_EMAIL_CAPACITY: int = 5
+    RATE_LIMIT_LOGIN_EMAIL_REFILL_PER_SECOND: float = 0.05
+
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.01
+
+    PAGINATION_DEFAULT_LIMIT: int = 50
+    PAGINATION_MAX_LIMIT: int = 200
+
+    EXPORT_BATCH_SIZE: int = 1000
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_ROWS: int = 100000
+
+    AVAILABLE_MOTORCYCLES_CACHE_TTL_SECONDS: float = 5
 
     model_config = SettingsConfigDict(
         env_file = ".env",
@@ -0,0 +1,13 @@
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+
+def constraint_name(exc: IntegrityError) -> Optional[str]:
+    orig = exc.orig
+
+    # psycopg2 exposes the server diagnostics directly on the DBAPI error.
+    diag = getattr(orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name
+
+    # asyncpg errors are wrapped by SQLAlchemy's adapter; the original is the cause.
+    return getattr(orig.__cause__, "constraint_name", None)
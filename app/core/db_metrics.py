@@ -0,0 +1,191 @@
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.core.config import settings
+
+logger = logging.getLogger("db")
+
+class RequestDbStats:
+
+    def __init__(self, record_statements: bool = False):
+        self.pool_checkouts = 0
+        self.pool_wait = 0.0
+        self.queries = 0
+        self.query_time = 0.0
+        # Statement text -> executions; only filled when N+1 detection is on.
+        self.statements: Optional[Counter] = Counter() if record_statements else None
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        if not self.statements:
+            return []
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+_request_stats: ContextVar[Optional[RequestDbStats]] = ContextVar("request_db_stats", default = None)
+
+def current_request_stats() -> Optional[RequestDbStats]:
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._query_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _request_stats.get()
+    if stats is None:
+        return
+
+    stats.queries += 1
+    stats.query_time += time.perf_counter() - context._query_started
+    if stats.statements is not None:
+        stats.statements[statement] += 1
+
+def instrument_queries(engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+@contextmanager
+def capture_queries(record_statements: bool = True) -> Iterator[RequestDbStats]:
+    """Count the statements run inside the block, e.g. around a service call or
+    an in-process ASGI request; the request middleware reuses an active capture."""
+    stats = RequestDbStats(record_statements = record_statements)
+    token = _request_stats.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[RequestDbStats]:
+    with capture_queries() as stats:
+        yield stats
+
+    if stats.queries > limit:
+        listing = "\n".join(f"  {count}x {statement}" for statement, count in stats.statements.most_common())
+        raise AssertionError(f"Expected at most {limit} queries, ran {stats.queries}:\n{listing}")
+
+
+class PoolMetrics:
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.in_use = 0
+        self.in_use_peak = 0
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def record_wait(self, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.pool_checkouts += 1
+            stats.pool_wait += seconds
+
+    def on_checkout(self, *args) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.in_use_peak = max(self.in_use_peak, self.in_use)
+
+    def on_checkin(self, *args) -> None:
+        with self._lock:
+            self.in_use -= 1
+
+    def attach(self, engine) -> None:
+        self._pool = engine.pool
+        event.listen(engine, "checkout", self.on_checkout)
+        event.listen(engine, "checkin", self.on_checkin)
+
+    def stats(self) -> dict:
+        with self._lock:
+            waits = self.checkouts + self.timeouts
+            data = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "in_use": self.in_use,
+                "in_use_peak": self.in_use_peak,
+                "wait_avg_ms": round(self.wait_total / waits * 1000, 3) if waits else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3)
+            }
+
+        if self._pool is not None:
+            data.update(
+                size = self._pool.size(),
+                checked_in = self._pool.checkedin(),
+                overflow = self._pool.overflow()
+            )
+        return data
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+
+    # QueuePool exposes no "checkout requested" event, so the time spent waiting
+    # for a free connection is measured around the pool's own acquire step.
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out)
+
+
+async def db_metrics_middleware(request: Request, call_next):
+    stats = _request_stats.get()
+    token = None
+
+    if stats is None:
+        stats = RequestDbStats(record_statements = settings.SQL_N_PLUS_ONE_DETECTION)
+        token = _request_stats.set(stats)
+
+    try:
+        response = await call_next(request)
+    finally:
+        if token is not None:
+            _request_stats.reset(token)
+
+    response.headers.append(
+        "Server-Timing",
+        f'db;dur={stats.query_time * 1000:.3f};desc="{stats.queries} queries", '
+        f'db-pool;dur={stats.pool_wait * 1000:.3f};desc="{stats.pool_checkouts} checkouts"'
+    )
+
+    fields = {
+        "method": request.method,
+        "path": request.url.path,
+        "status": response.status_code,
+        "db_queries": stats.queries,
+        "db_ms": round(stats.query_time * 1000, 3),
+        "db_pool_wait_ms": round(stats.pool_wait * 1000, 3)
+    }
+    logger.info(" ".join(f"{key}={value}" for key, value in fields.items()), extra = fields)
+
+    for statement, count in stats.repeated_statements(settings.SQL_N_PLUS_ONE_THRESHOLD):
+        logger.warning(
+            "Possible N+1: %s %s ran the same statement %d times: %s",
+            request.method, request.url.path, count, " ".join(statement.split())
+        )
+
+    return response
@@ -10,7 +10,8 @@ def app_exception_handler(request: Request, exc: AppException):
         content = ErrorResponse(
             error = exc.error, 
             message = exc.message
-        ).model_dump()
+        ).model_dump(),
+        headers = exc.headers
     )
 
 def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -1,5 +1,6 @@
 class AppException(Exception):
-    def __init__(self, error: str, message: str, status_code: int = 400):
+    def __init__(self, error: str, message: str, status_code: int = 400, headers: dict = None):
         self.error = error
         self.message = message
-        self.status_code = status_code
\ No newline at end of file
+        self.status_code = status_code
+        self.headers = headers
\ No newline at end of file
@@ -1,6 +1,12 @@
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
 from jose import jwt
 from os import getenv
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import register_metrics
 
 SECRET_KEY = getenv("JWT_SECRET_KEY")
 ALGORITHM = getenv("JWT_ALGORITHM")
@@ -13,6 +19,13 @@ if not SECRET_KEY or not ALGORITHM:
 
 ISSUER = "mottu-api"
 
+verified_tokens = TTLCache(
+    maxsize = settings.JWT_VERIFIED_CACHE_MAX_SIZE,
+    ttl = ACCESS_TOKEN_EXPIRES_MINUTES * 60
+)
+
+register_metrics("verified_tokens", verified_tokens.stats)
+
 def create_access_token(user_id: int, role: str) -> str:
     now = datetime.utcnow()
 
@@ -33,6 +46,7 @@ def create_refresh_token(user_id: int) -> str:
     payload = {
         "sub": str(user_id),
         "type": "refresh",
+        "jti": uuid.uuid4().hex,
         "iss": ISSUER,
         "iat": int(now.timestamp()),
         "exp": int((now + timedelta(days=REFRESH_TOKEN_EXPIRES_DAYS)).timestamp())
@@ -40,10 +54,26 @@ def create_refresh_token(user_id: int) -> str:
 
     return jwt.encode(payload, SECRET_KEY, algorithm = ALGORITHM)
 
-def decode_token(token: str):
+def _verify_token(token: str) -> dict:
     return jwt.decode(
         token, 
         SECRET_KEY, 
         algorithms = [ALGORITHM],
         issuer = ISSUER
     )
+
+def decode_token(token: str) -> dict:
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+
+    payload = verified_tokens.get(key)
+    if payload is not None:
+        return dict(payload)
+
+    payload = _verify_token(token)
+
+    # Entries must never outlive the token itself, so the TTL is pinned to exp.
+    ttl = payload["exp"] - time.time()
+    if ttl > 0:
+        verified_tokens.set(key, dict(payload), ttl = ttl)
+
+    return payload
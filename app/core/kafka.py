@@ -1,20 +1,96 @@
-import json
+import logging
+import threading
+import time
+from typing import Optional
 from aiokafka import AIOKafkaProducer  
 import os
 import asyncio
+from fastapi import status
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.core.metrics import register_metrics
+from app.events.codec import CONTENT_TYPE_HEADER, ENCODINGS, encode
+
+logger = logging.getLogger("kafka_producer")
+
+PRODUCER_MODES = ("fire_and_forget", "wait")
+
+class ProducerMetrics:
+
+    def __init__(self):
+        self.enqueued = 0
+        self.delivered = 0
+        self.failed = 0
+        self.buffer_full = 0
+        self.in_flight = 0
+        self.in_flight_peak = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self._lock = threading.Lock()
+
+    def on_enqueue(self) -> None:
+        with self._lock:
+            self.enqueued += 1
+            self.in_flight += 1
+            self.in_flight_peak = max(self.in_flight_peak, self.in_flight)
+
+    def on_done(self, latency: float, failed: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if failed:
+                self.failed += 1
+                return
+            self.delivered += 1
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "mode": settings.KAFKA_PRODUCER_MODE,
+                "encoding": settings.KAFKA_EVENT_ENCODING,
+                "enqueued": self.enqueued,
+                "delivered": self.delivered,
+                "failed": self.failed,
+                "buffer_full": self.buffer_full,
+                "buffer_depth": self.in_flight,
+                "buffer_peak": self.in_flight_peak,
+                "buffer_size": settings.KAFKA_SEND_BUFFER_SIZE,
+                "delivery_avg_ms": round(self.latency_total / self.delivered * 1000, 3) if self.delivered else 0.0,
+                "delivery_max_ms": round(self.latency_max * 1000, 3)
+            }
+
+producer_metrics = ProducerMetrics()
+
+register_metrics("kafka_producer", producer_metrics.stats)
+
 
 class KafkaProducer:
 
+    _producer = None
+    _buffer = None
+    _content_type = None
+
     @classmethod
     async def start(cls, retries: int = 10, delay: int = 3):
+        if settings.KAFKA_PRODUCER_MODE not in PRODUCER_MODES:
+            raise RuntimeError(f"Unknown KAFKA_PRODUCER_MODE: {settings.KAFKA_PRODUCER_MODE}")
+        if settings.KAFKA_EVENT_ENCODING not in ENCODINGS:
+            raise RuntimeError(f"Unknown KAFKA_EVENT_ENCODING: {settings.KAFKA_EVENT_ENCODING}")
+
         for attempt in range(retries):
             try:
                 producer = AIOKafkaProducer(
                     bootstrap_servers = os.getenv("KAFKA_BOOTSTRAP_SERVERS"),
-                    value_serializer = lambda v: json.dumps(v).encode("utf-8")
+                    key_serializer = lambda k: k.encode("utf-8") if k is not None else None,
+                    linger_ms = settings.KAFKA_LINGER_MS,
+                    max_batch_size = settings.KAFKA_MAX_BATCH_SIZE,
+                    compression_type = settings.KAFKA_COMPRESSION_TYPE
                 )
                 await producer.start()
                 cls._producer = producer 
+                cls._buffer = asyncio.Semaphore(settings.KAFKA_SEND_BUFFER_SIZE)
+                cls._content_type = ENCODINGS[settings.KAFKA_EVENT_ENCODING]
                 return
         
             except Exception as e:
@@ -25,12 +101,73 @@ class KafkaProducer:
     @classmethod
     async def stop(cls):
         if cls._producer:
+            # stop() flushes whatever is still buffered before closing.
             await cls._producer.stop()
             cls._producer = None
-    
+
     @classmethod
-    async def send(cls, topic: str, message: dict):
+    def _on_delivery(cls, started: float, delivery: asyncio.Future) -> None:
+        cls._buffer.release()
+        failed = delivery.cancelled() or delivery.exception() is not None
+
+        if failed:
+            logger.error("Kafka delivery failed: %s", "cancelled" if delivery.cancelled() else delivery.exception())
+        producer_metrics.on_done(time.perf_counter() - started, failed)
+
+    @classmethod
+    async def _enqueue(cls, topic: str, message: dict, key: Optional[str] = None) -> asyncio.Future:
         if not cls._producer:
             await cls.start() 
+
+        # Bounded buffer: once KAFKA_SEND_BUFFER_SIZE messages are awaiting
+        # acknowledgement, callers wait here instead of piling up memory.
+        try:
+            await asyncio.wait_for(cls._buffer.acquire(), settings.KAFKA_SEND_BUFFER_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            producer_metrics.buffer_full += 1
+            raise AppException(
+                error = "EVENT_BUFFER_FULL",
+                message = "Event publishing is saturated. Please try again shortly.",
+                status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        started = time.perf_counter()
+        producer_metrics.on_enqueue()
+
+        try:
+            delivery = await cls._producer.send(
+                topic,
+                encode(message, cls._content_type),
+                key = key,
+                headers = [(CONTENT_TYPE_HEADER, cls._content_type.encode("utf-8"))]
+            )
+        except Exception:
+            cls._buffer.release()
+            producer_metrics.on_done(0.0, failed = True)
+            raise
+
+        delivery.add_done_callback(lambda future: cls._on_delivery(started, future))
+        return delivery
     
-        await cls._producer.send_and_wait(topic, message)
+    @classmethod
+    async def send(cls, topic: str, message: dict):
+        delivery = await cls._enqueue(topic, message)
+
+        if settings.KAFKA_PRODUCER_MODE == "wait":
+            await delivery
+
+    @classmethod
+    async def send_many(cls, topic: str, messages: list[dict]):
+        # Enqueue everything first so the producer can pack the messages into
+        # batches; in "wait" mode, then wait for all deliveries together.
+        deliveries = [await cls._enqueue(topic, message) for message in messages]
+
+        if settings.KAFKA_PRODUCER_MODE == "wait":
+            await asyncio.gather(*deliveries)
+
+    @classmethod
+    async def send_batch_and_wait(cls, records: list[tuple[str, Optional[str], dict]]):
+        # (topic, key, message) records, enqueued in order and acknowledged
+        # together whatever the producer mode; used by the outbox relay.
+        deliveries = [await cls._enqueue(topic, message, key) for topic, key, message in records]
+        await asyncio.gather(*deliveries)
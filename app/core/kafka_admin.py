@@ -1,18 +1,68 @@
 import asyncio
-from aiokafka.admin import AIOKafkaAdminClient, NewTopic
-import os
+import logging
+from aiokafka.admin import AIOKafkaAdminClient, NewPartitions, NewTopic
+from confluent_kafka.admin import AdminClient, AlterConfigOpType, ConfigEntry, ConfigResource, ResourceType
+from app.core.config import settings
+
+logger = logging.getLogger("kafka_admin")
 
 KAFKA_TOPICS = [
     {
-        "name": os.getenv("KAFKA_MOTORCYCLE_TOPIC"),
-        "partitions": 1,
-        "replication_factor": 1
+        "name": settings.KAFKA_MOTORCYCLE_TOPIC,
+        "partitions": settings.KAFKA_MOTORCYCLE_TOPIC_PARTITIONS,
+        "replication_factor": settings.KAFKA_MOTORCYCLE_TOPIC_REPLICATION_FACTOR,
+        "config": {
+            "cleanup.policy": settings.KAFKA_MOTORCYCLE_TOPIC_CLEANUP_POLICY,
+            "retention.ms": str(settings.KAFKA_MOTORCYCLE_TOPIC_RETENTION_MS)
+        }
     }
 ]
 
+async def _expand_partitions(admin: AIOKafkaAdminClient, existing: list[dict]) -> None:
+    current = {
+        topic["topic"]: len(topic["partitions"])
+        for topic in await admin.describe_topics([t["name"] for t in existing])
+    }
+
+    to_expand = {}
+    for t in existing:
+        count = current.get(t["name"], t["partitions"])
+
+        if count < t["partitions"]:
+            to_expand[t["name"]] = NewPartitions(total_count = t["partitions"])
+        elif count > t["partitions"]:
+            # Kafka cannot remove partitions; keep the topic as it is.
+            logger.warning("Topic %s has %d partitions, more than the %d configured", t["name"], count, t["partitions"])
+
+    if to_expand:
+        # Only keys produced from now on move to the new partitions; per-key
+        # ordering holds again once the events already in flight are consumed.
+        await admin.create_partitions(to_expand)
+
+def _set_topic_configs(topics: list[dict]) -> None:
+    # IncrementalAlterConfigs sets only the keys in the spec, so overrides an
+    # operator put on the topic survive restarts. aiokafka only speaks the
+    # legacy AlterConfigs, which replaces the topic's whole override set.
+    admin = AdminClient({"bootstrap.servers": settings.KAFKA_BOOTSTRAP_SERVERS})
+
+    futures = admin.incremental_alter_configs([
+        ConfigResource(
+            ResourceType.TOPIC,
+            t["name"],
+            incremental_configs = [
+                ConfigEntry(name, value, incremental_operation = AlterConfigOpType.SET)
+                for name, value in t["config"].items()
+            ]
+        )
+        for t in topics
+    ])
+
+    for future in futures.values():
+        future.result()
+
 async def ensure_kafka_topics(retries: int = 10, delay: int = 3) -> None:
     admin = AIOKafkaAdminClient(
-        bootstrap_servers = os.getenv("KAFKA_BOOTSTRAP_SERVERS")
+        bootstrap_servers = settings.KAFKA_BOOTSTRAP_SERVERS
     )
 
     for attempt in range(retries):
@@ -25,7 +75,8 @@ async def ensure_kafka_topics(retries: int = 10, delay: int = 3) -> None:
                 NewTopic(
                     name = t["name"],
                     num_partitions = t["partitions"],
-                    replication_factor = t["replication_factor"]
+                    replication_factor = t["replication_factor"],
+                    topic_configs = t["config"]
                 )
                 for t in KAFKA_TOPICS
                 if t["name"] not in existing_topics
@@ -34,6 +85,12 @@ async def ensure_kafka_topics(retries: int = 10, delay: int = 3) -> None:
             if topics_to_create: 
                 await admin.create_topics(topics_to_create)
 
+            existing = [t for t in KAFKA_TOPICS if t["name"] in existing_topics]
+
+            if existing:
+                await _expand_partitions(admin, existing)
+                await asyncio.to_thread(_set_topic_configs, existing)
+
             return
         
         except Exception:
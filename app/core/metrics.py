@@ -0,0 +1,9 @@
+from typing import Callable, Dict
+
+_collectors: Dict[str, Callable[[], dict]] = {}
+
+def register_metrics(name: str, collector: Callable[[], dict]) -> None:
+    _collectors[name] = collector
+
+def collect_metrics() -> dict:
+    return {name: collector() for name, collector in _collectors.items()}
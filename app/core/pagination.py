@@ -0,0 +1,47 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+from fastapi import Query, status
+from app.core.config import settings
+from app.core.exceptions import AppException
+
+@dataclass(frozen = True)
+class PageParams:
+    after_id: Optional[int]
+    limit: int
+
+def encode_cursor(last_id: int) -> str:
+    raw = json.dumps({"id": last_id}, separators = (",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        last_id = json.loads(base64.urlsafe_b64decode(padded))["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        last_id = None
+
+    if not isinstance(last_id, int):
+        raise AppException(
+            error = "INVALID_CURSOR",
+            message = "The pagination cursor is invalid.",
+            status_code = status.HTTP_400_BAD_REQUEST
+        )
+    return last_id
+
+def page_params(
+    cursor: Optional[str] = Query(None, description = "Opaque cursor returned as next_cursor by the previous page."),
+    limit: int = Query(settings.PAGINATION_DEFAULT_LIMIT, ge = 1, description = "Page size, capped server-side.")
+) -> PageParams:
+    return PageParams(
+        after_id = decode_cursor(cursor) if cursor else None,
+        limit = min(limit, settings.PAGINATION_MAX_LIMIT)
+    )
+
+def paginate(rows: Sequence, limit: int) -> Tuple[list, Optional[str]]:
+    # Repositories fetch limit + 1 rows; the extra row only signals that another page exists.
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(items[-1].id) if len(rows) > limit else None
+    return items, next_cursor
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+import asyncpg
+from app.database import ASYNC_DATABASE_URL
+
+logger = logging.getLogger("pg_listener")
+
+class PgListener:
+
+    def __init__(self, reconnect_delay: float = 3):
+        self.reconnect_delay = reconnect_delay
+        self._handlers: Dict[str, List[Callable[[Optional[str]], None]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, channel: str, handler: Callable[[Optional[str]], None]) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def _dispatch(self, connection, pid, channel: str, payload: str) -> None:
+        for handler in self._handlers.get(channel, []):
+            handler(payload)
+
+    def _dispatch_all(self) -> None:
+        # Notifications sent while disconnected are lost, so every subscriber is
+        # told to drop its state (payload None) after (re)connecting.
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                handler(None)
+
+    async def _run(self) -> None:
+        dsn = ASYNC_DATABASE_URL.set(drivername = "postgresql").render_as_string(hide_password = False)
+
+        while True:
+            try:
+                connection = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+
+                for channel in self._handlers:
+                    await connection.add_listener(channel, self._dispatch)
+
+                self._dispatch_all()
+                await closed.wait()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("LISTEN connection failed: %s", e)
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+pg_listener = PgListener()
@@ -0,0 +1,136 @@
+import math
+import time
+from typing import Dict, Tuple
+from fastapi import Request, status
+from sqlalchemy import text
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.core.metrics import register_metrics
+
+class InMemoryRateLimitBackend:
+
+    def __init__(self, maxsize: int = 100000):
+        self._buckets = TTLCache(maxsize = maxsize, ttl = 0)
+
+    async def consume(self, key: str, capacity: int, refill_rate: float) -> Tuple[bool, float]:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+
+        tokens = float(capacity)
+        if bucket is not None:
+            last_tokens, updated_at = bucket
+            tokens = min(capacity, last_tokens + (now - updated_at) * refill_rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+
+        # An idle bucket is full again after capacity / refill_rate seconds, so
+        # it can be dropped then instead of lingering for every IP ever seen.
+        self._buckets.set(key, (tokens, now), ttl = (capacity - tokens) / refill_rate)
+
+        return allowed, tokens
+
+
+class PostgresRateLimitBackend:
+
+    _REFILL = (
+        "LEAST(:capacity, rate_limit_buckets.tokens + "
+        "EXTRACT(EPOCH FROM now() - rate_limit_buckets.updated_at) * :refill_rate)"
+    )
+
+    _CONSUME = text(f"""
+        INSERT INTO rate_limit_buckets (key, tokens, allowed, updated_at)
+        VALUES (:key, :capacity - 1, true, now())
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = CASE WHEN {_REFILL} >= 1 THEN {_REFILL} - 1 ELSE {_REFILL} END,
+            allowed = {_REFILL} >= 1,
+            updated_at = now()
+        RETURNING allowed, tokens
+    """)
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    async def consume(self, key: str, capacity: int, refill_rate: float) -> Tuple[bool, float]:
+        async with self._engine.begin() as conn:
+            row = (await conn.execute(
+                self._CONSUME,
+                {"key": key, "capacity": capacity, "refill_rate": refill_rate}
+            )).one()
+
+        return row.allowed, float(row.tokens)
+
+
+class RateLimiter:
+
+    def __init__(self, name: str, capacity: int, refill_rate: float, backend):
+        self.name = name
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.backend = backend
+        self.admitted = 0
+        self.rejected = 0
+
+    async def hit(self, key: str) -> None:
+        allowed, tokens = await self.backend.consume(f"{self.name}:{key}", self.capacity, self.refill_rate)
+
+        if allowed:
+            self.admitted += 1
+            return
+
+        self.rejected += 1
+        retry_after = max(1, math.ceil((1 - tokens) / self.refill_rate))
+
+        raise AppException(
+            error = "RATE_LIMITED",
+            message = "Too many requests. Please try again later.",
+            status_code = status.HTTP_429_TOO_MANY_REQUESTS,
+            headers = {"Retry-After": str(retry_after)}
+        )
+
+    def stats(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "refill_per_second": self.refill_rate,
+            "admitted": self.admitted,
+            "rejected": self.rejected
+        }
+
+
+def _build_backend():
+    if settings.RATE_LIMIT_BACKEND == "postgres":
+        from app.database import async_engine
+        return PostgresRateLimitBackend(async_engine)
+
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return InMemoryRateLimitBackend()
+
+    raise RuntimeError(f"Unknown RATE_LIMIT_BACKEND: {settings.RATE_LIMIT_BACKEND}")
+
+_backend = _build_backend()
+
+auth_ip_limiter = RateLimiter(
+    name = "auth_ip",
+    capacity = settings.RATE_LIMIT_AUTH_IP_CAPACITY,
+    refill_rate = settings.RATE_LIMIT_AUTH_IP_REFILL_PER_SECOND,
+    backend = _backend
+)
+
+login_email_limiter = RateLimiter(
+    name = "login_email",
+    capacity = settings.RATE_LIMIT_LOGIN_EMAIL_CAPACITY,
+    refill_rate = settings.RATE_LIMIT_LOGIN_EMAIL_REFILL_PER_SECOND,
+    backend = _backend
+)
+
+_limiters: Dict[str, RateLimiter] = {
+    limiter.name: limiter for limiter in (auth_ip_limiter, login_email_limiter)
+}
+
+register_metrics("rate_limit", lambda: {name: limiter.stats() for name, limiter in _limiters.items()})
+
+async def limit_auth_by_ip(request: Request) -> None:
+    client_ip = request.client.host if request.client else "unknown"
+    await auth_ip_limiter.hit(client_ip)
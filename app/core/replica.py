@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from fastapi import Request
+from sqlalchemy import text
+from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.database import replica_engine
+
+logger = logging.getLogger("replica")
+
+READ_YOUR_WRITES_COOKIE = "primary_until"
+CONSISTENCY_HEADER = "x-read-consistency"
+
+# Seconds the replica is behind. A replica with nothing left to replay is
+# current even if the primary has been idle since the last replayed commit.
+LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+class ReplicaRouter:
+
+    def __init__(self, engine, max_lag: float, probe_interval: float):
+        self.engine = engine
+        self.max_lag = max_lag
+        self.probe_interval = probe_interval
+        self.lag: Optional[float] = None
+        self.probe_errors = 0
+        self.routed = {"replica": 0, "no_replica": 0, "lagging": 0, "read_your_writes": 0}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.lag is not None and self.lag <= self.max_lag
+
+    async def probe(self) -> None:
+        try:
+            async with self.engine.connect() as conn:
+                self.lag = float(await conn.scalar(LAG_SQL))
+        except Exception as e:
+            # Unknown lag counts as too much lag until the next probe succeeds.
+            self.lag = None
+            self.probe_errors += 1
+            logger.warning("Replica lag probe failed: %s", e)
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.probe_interval)
+
+    def start(self) -> None:
+        if self.engine is not None and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def use_replica(self, request: Request) -> bool:
+        if self.engine is None:
+            reason = "no_replica"
+        elif _reads_own_writes(request):
+            reason = "read_your_writes"
+        elif not self.healthy:
+            reason = "lagging"
+        else:
+            reason = "replica"
+
+        self.routed[reason] += 1
+        return reason == "replica"
+
+    def stats(self) -> dict:
+        return {
+            "configured": self.engine is not None,
+            "lag_seconds": self.lag,
+            "max_lag_seconds": self.max_lag,
+            "healthy": self.healthy,
+            "probe_errors": self.probe_errors,
+            "routed": dict(self.routed)
+        }
+
+def _reads_own_writes(request: Request) -> bool:
+    if request.headers.get(CONSISTENCY_HEADER, "").lower() == "primary":
+        return True
+
+    try:
+        return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+async def read_your_writes_middleware(request: Request, call_next):
+    response = await call_next(request)
+
+    # After a successful write, pin this client's reads to the primary long
+    # enough for the replica to catch up with what it just changed.
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        response.set_cookie(
+            READ_YOUR_WRITES_COOKIE,
+            str(time.time() + settings.READ_YOUR_WRITES_SECONDS),
+            max_age = settings.READ_YOUR_WRITES_SECONDS,
+            httponly = True,
+            samesite = "lax"
+        )
+    return response
+
+replica_router = ReplicaRouter(
+    engine = replica_engine,
+    max_lag = settings.REPLICA_MAX_LAG_SECONDS,
+    probe_interval = settings.REPLICA_LAG_PROBE_INTERVAL_SECONDS
+)
+
+register_metrics("replica", replica_router.stats)
@@ -0,0 +1,110 @@
+import hashlib
+import math
+import threading
+import time
+from typing import Dict, Iterable, Tuple
+from app.core.config import settings
+from app.core.metrics import register_metrics
+
+class BloomFilter:
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size = 16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationIndex:
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.lookups = 0
+        self.bloom_negatives = 0
+        self.false_positives = 0
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(capacity, error_rate)
+        # Live entries the current filter was sized for; past this it is rebuilt.
+        self._bloom_capacity = capacity
+        # Kept in expiry order (refresh tokens share one lifetime), so expired
+        # entries can be dropped from the front as new ones come in.
+        self._revoked: Dict[str, float] = {}
+
+    def _rebuild(self) -> None:
+        now = time.time()
+        self._revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+        # Twice the live count, so the next rebuild only comes after it doubles.
+        self._bloom_capacity = max(self.capacity, len(self._revoked) * 2)
+        self._bloom = BloomFilter(self._bloom_capacity, self.error_rate)
+
+        for jti in self._revoked:
+            self._bloom.add(jti)
+
+    def _prune_expired(self, now: float) -> None:
+        while self._revoked:
+            jti = next(iter(self._revoked))
+            if self._revoked[jti] > now:
+                return
+            del self._revoked[jti]
+
+    def load(self, entries: Iterable[Tuple[str, float]]) -> None:
+        with self._lock:
+            self._revoked = dict(sorted(entries, key = lambda entry: entry[1]))
+            self._rebuild()
+
+    def add(self, jti: str, expires_at: float) -> None:
+        with self._lock:
+            self._prune_expired(time.time())
+            self._revoked[jti] = expires_at
+            self._bloom.add(jti)
+
+            if len(self._revoked) > self._bloom_capacity:
+                self._rebuild()
+
+    def is_revoked(self, jti: str) -> bool:
+        with self._lock:
+            self.lookups += 1
+
+            if jti not in self._bloom:
+                self.bloom_negatives += 1
+                return False
+
+            if jti in self._revoked:
+                return True
+
+            self.false_positives += 1
+            return False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "revoked": len(self._revoked),
+                "bloom_capacity": self._bloom_capacity,
+                "bloom_bits": self._bloom.size,
+                "bloom_hashes": self._bloom.num_hashes,
+                "lookups": self.lookups,
+                "bloom_negatives": self.bloom_negatives,
+                "false_positives": self.false_positives
+            }
+
+revocation_index = RevocationIndex(
+    capacity = settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate = settings.REVOCATION_BLOOM_ERROR_RATE
+)
+
+register_metrics("refresh_token_revocation", revocation_index.stats)
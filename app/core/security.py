@@ -1,4 +1,14 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+from fastapi import status
 from passlib.context import CryptContext
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.core.metrics import register_metrics
 
 pwd_context = CryptContext(schemes = ["bcrypt"], deprecated = "auto")
 
@@ -6,4 +16,119 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasherPool:
+
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers = workers, thread_name_prefix = "password-hasher")
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                raise AppException(
+                    error = "AUTH_SERVICE_BUSY",
+                    message = "Authentication service is busy. Please try again shortly.",
+                    status_code = status.HTTP_503_SERVICE_UNAVAILABLE,
+                    headers = {"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)}
+                )
+            self.in_flight += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def run(self, fn, *args):
+        self._acquire()
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._release()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait = False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "capacity": self.capacity,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+password_hasher = PasswordHasherPool(
+    workers = settings.PASSWORD_HASH_WORKERS,
+    queue_size = settings.PASSWORD_HASH_QUEUE_SIZE
+)
+
+register_metrics("password_hasher", password_hasher.stats)
+
+
+def _hash_chunk(passwords: list[str]) -> list[str]:
+    return [hash_password(password) for password in passwords]
+
+class BulkPasswordHasher:
+
+    # bcrypt holds the GIL for most of its work, so bulk imports hash in worker
+    # processes to use every core. Interactive logins and registrations keep
+    # the thread pool above, which has no process start-up or pickling cost.
+    def __init__(self, workers: Optional[int], chunk_size: int):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.hashed = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs the event loop and Kafka threads is unsafe.
+            self._executor = ProcessPoolExecutor(
+                max_workers = self.workers,
+                mp_context = multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        loop = asyncio.get_running_loop()
+        chunks = [passwords[i:i + self.chunk_size] for i in range(0, len(passwords), self.chunk_size)]
+
+        results = await asyncio.gather(*(loop.run_in_executor(self._pool(), _hash_chunk, chunk) for chunk in chunks))
+        self.hashed += len(passwords)
+
+        return [hashed for chunk in results for hashed in chunk]
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait = False, cancel_futures = True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "started": self._executor is not None,
+            "hashed": self.hashed
+        }
+
+bulk_password_hasher = BulkPasswordHasher(
+    workers = settings.BULK_PASSWORD_HASH_WORKERS,
+    chunk_size = settings.BULK_PASSWORD_HASH_CHUNK_SIZE
+)
+
+register_metrics("bulk_password_hasher", bulk_password_hasher.stats)
+
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.run(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
@@ -1,10 +1,21 @@
-from app.database import SessionLocal
+from app.core.unit_of_work import UnitOfWork
 from app.services.user_service import UserService
+from app.core.revocation import revocation_index
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.services.plan_catalog import rental_plan_catalog
 
-def create_default_admin():
-    db = SessionLocal()
+async def create_default_admin():
+    async with UnitOfWork() as uow:
+        await UserService.create_admin_if_not_exists(uow.session)
+        await uow.commit()
 
-    try:
-        UserService.create_admin_if_not_exists(db)
-    finally:
-        db.close()
\ No newline at end of file
+async def load_revocation_index():
+    async with UnitOfWork() as uow:
+        await RevokedTokenRepository.delete_expired(uow.session)
+        revocation_index.load(
+            (jti, expires_at.timestamp()) for jti, expires_at in await RevokedTokenRepository.list_active(uow.session)
+        )
+        await uow.commit()
+
+async def load_rental_plan_catalog():
+    await rental_plan_catalog.reload()
@@ -0,0 +1,48 @@
+import inspect
+import logging
+from typing import Any, Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal
+
+logger = logging.getLogger("unit_of_work")
+
+_ON_COMMIT = "on_commit"
+
+def on_commit(db: AsyncSession, callback: Callable[[], Any]) -> None:
+    """Run callback (sync or async) once the session's transaction has committed."""
+    db.info.setdefault(_ON_COMMIT, []).append(callback)
+
+
+class UnitOfWork:
+
+    # Repositories only flush; the owner of the unit of work commits once, after
+    # every step of the operation succeeded. Whatever was not committed by the
+    # time the unit of work closes is rolled back.
+    def __init__(self, session_factory = AsyncSessionLocal):
+        self._session_factory = session_factory
+        self.session: Optional[AsyncSession] = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.session = self._session_factory()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.session.info.pop(_ON_COMMIT, None)
+        await self.session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+        for callback in self.session.info.pop(_ON_COMMIT, []):
+            # The data is already durable; a failing side effect must not turn
+            # the request into an error.
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("on_commit callback failed")
+
+    async def rollback(self) -> None:
+        self.session.info.pop(_ON_COMMIT, None)
+        await self.session.rollback()
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Optional
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import register_metrics
+
+@dataclass(frozen = True)
+class CachedUser:
+    id: int
+    name: Optional[str]
+    email: str
+    role: str
+    cnh_type: Optional[str]
+    cnh_photo_path: Optional[str]
+
+    @classmethod
+    def from_model(cls, user) -> "CachedUser":
+        return cls(
+            id = user.id,
+            name = user.name,
+            email = user.email,
+            role = user.role,
+            cnh_type = user.cnh_type,
+            cnh_photo_path = user.cnh_photo_path
+        )
+
+user_cache = TTLCache(
+    maxsize = settings.USER_CACHE_MAX_SIZE,
+    ttl = settings.USER_CACHE_TTL_SECONDS
+)
+
+register_metrics("user_cache", user_cache.stats)
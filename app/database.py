@@ -1,7 +1,12 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
 from os import getenv
 from dotenv import load_dotenv
+from app.core.config import settings
+from app.core.db_metrics import InstrumentedAsyncQueuePool, instrument_queries, pool_metrics
+from app.core.metrics import register_metrics
 
 load_dotenv()
 
@@ -10,7 +15,41 @@ DATABASE_URL = getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set!")
 
+ASYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername = "postgresql+asyncpg")
+
 Base = declarative_base()
 
+# Sync engine for code that runs outside the event loop (Kafka consumer thread, scripts, Alembic).
 engine = create_engine(DATABASE_URL, pool_pre_ping = True)
-SessionLocal = sessionmaker(autocommit = False, autoflush = False, bind = engine) 
\ No newline at end of file
+SessionLocal = sessionmaker(autocommit = False, autoflush = False, bind = engine) 
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass = InstrumentedAsyncQueuePool,
+    pool_pre_ping = True,
+    pool_size = settings.DB_POOL_SIZE,
+    max_overflow = settings.DB_MAX_OVERFLOW,
+    pool_timeout = settings.DB_POOL_TIMEOUT,
+    pool_recycle = settings.DB_POOL_RECYCLE
+)
+AsyncSessionLocal = async_sessionmaker(bind = async_engine, autoflush = False, expire_on_commit = False)
+
+# Optional streaming replica for GET endpoints; see app.core.replica for routing.
+replica_engine = None
+ReplicaSessionLocal = None
+
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        make_url(settings.DATABASE_REPLICA_URL).set(drivername = "postgresql+asyncpg"),
+        pool_pre_ping = True,
+        pool_size = settings.DB_POOL_SIZE,
+        max_overflow = settings.DB_MAX_OVERFLOW,
+        pool_timeout = settings.DB_POOL_TIMEOUT,
+        pool_recycle = settings.DB_POOL_RECYCLE
+    )
+    ReplicaSessionLocal = async_sessionmaker(bind = replica_engine, autoflush = False, expire_on_commit = False)
+    instrument_queries(replica_engine.sync_engine)
+
+pool_metrics.attach(async_engine.sync_engine)
+instrument_queries(async_engine.sync_engine)
+register_metrics("db_pool", pool_metrics.stats)
@@ -0,0 +1,55 @@
+import json
+from datetime import datetime, timezone
+from typing import Optional
+import msgpack
+
+# Producers tag every message with its encoding; consumers decode by this
+# header, so both encodings can coexist on a topic during a rollout.
+CONTENT_TYPE_HEADER = "content-type"
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+
+ENCODINGS = {"json": JSON, "msgpack": MSGPACK}
+
+def envelope(event_type: str, version: int, data: dict, occurred_at: Optional[str] = None) -> dict:
+    return {
+        "type": event_type,
+        "version": version,
+        "occurred_at": occurred_at or datetime.now(timezone.utc).isoformat(),
+        "data": data
+    }
+
+def encode(event: dict, content_type: str) -> bytes:
+    if content_type == MSGPACK:
+        return msgpack.packb(event)
+
+    if content_type == JSON:
+        return json.dumps(event, separators = (",", ":")).encode("utf-8")
+
+    raise ValueError(f"Unsupported event content type: {content_type}")
+
+def _from_legacy(event: dict) -> dict:
+    # Messages published before the envelope: a flat JSON dict with an "event" name.
+    data = dict(event)
+    event_type = data.pop("event")
+    occurred_at = data.pop("created_at", None)
+    return envelope(event_type, 1, data, occurred_at)
+
+def decode(value: bytes, content_type: Optional[str]) -> dict:
+    if content_type == MSGPACK:
+        event = msgpack.unpackb(value)
+    elif content_type in (None, JSON):
+        event = json.loads(value)
+    else:
+        raise ValueError(f"Unsupported event content type: {content_type}")
+
+    if "type" not in event:
+        return _from_legacy(event)
+    return event
+
+def content_type_from_headers(headers: Optional[list]) -> Optional[str]:
+    for name, value in headers or ():
+        if name == CONTENT_TYPE_HEADER:
+            return value.decode("utf-8") if isinstance(value, bytes) else value
+    return None
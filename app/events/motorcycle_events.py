@@ -1,13 +1,13 @@
-from datetime import datetime, timezone
+from app.events.codec import envelope
 from app.models.motorcycle import Motorcycle
 
+MOTORCYCLE_CREATED = "MOTORCYCLE_CREATED"
+MOTORCYCLE_CREATED_VERSION = 1
+
 def motorcycle_created_event(motorcycle: Motorcycle) -> dict:
-    return {
-        "event": "MOTORCYCLE_CREATED",
+    return envelope(MOTORCYCLE_CREATED, MOTORCYCLE_CREATED_VERSION, {
         "motorcycle_id": motorcycle.id,
         "model": motorcycle.model,
         "vin": motorcycle.vin,
-        "year": motorcycle.year,
-        "created_at": datetime.now(timezone.utc).isoformat()
-    }
-
+        "year": motorcycle.year
+    })
@@ -1,14 +1,21 @@
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel
-from app.api.routes import users, admin, auth, motorcycles, rentals, test
+from app.api.routes import users, admin, auth, motorcycles, rentals, rental_plans, test
 from app.core.exceptions import AppException
 from app.core.exception_handlers import app_exception_handler, validation_exception_handler, generic_exception_handler
 from app.core.kafka import KafkaProducer
 from app.messaging.consumer import start_motorcycle_consumer
 from app.core.kafka_admin import ensure_kafka_topics
 from app.core.logging import setup_logging
-from app.core.startup import create_default_admin
+from app.core.startup import create_default_admin, load_revocation_index, load_rental_plan_catalog
+from app.core.security import bulk_password_hasher, password_hasher
+from app.database import async_engine, replica_engine
+from app.core.db_metrics import db_metrics_middleware
+from app.core.pg_listener import pg_listener
+from app.core.replica import read_your_writes_middleware, replica_router
+from app.core.config import settings
+from app.messaging.outbox_relay import outbox_relay
 
 async def lifespan(app: FastAPI):
 
@@ -19,11 +26,26 @@ async def lifespan(app: FastAPI):
     
     start_motorcycle_consumer()
     
-    create_default_admin()
+    await create_default_admin()
+    await load_revocation_index()
+    await load_rental_plan_catalog()
+
+    pg_listener.start()
+    replica_router.start()
+    if settings.OUTBOX_RELAY_ENABLED:
+        outbox_relay.start()
 
     yield
     
+    await outbox_relay.stop()
+    await pg_listener.stop()
+    await replica_router.stop()
     await KafkaProducer.stop()
+    password_hasher.shutdown()
+    bulk_password_hasher.shutdown()
+    await async_engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
 
 
 app = FastAPI(
@@ -39,9 +61,13 @@ app.include_router(auth.router)
 
 app.include_router(motorcycles.router)
 app.include_router(rentals.router)
+app.include_router(rental_plans.router)
 
 # app.include_router(test.router)
 
+app.middleware("http")(db_metrics_middleware)
+app.middleware("http")(read_your_writes_middleware)
+
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
\ No newline at end of file
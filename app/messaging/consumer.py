@@ -1,16 +1,120 @@
-import json 
+import logging
 import threading
-from confluent_kafka import Consumer
+import time
+from collections import defaultdict
+from typing import Optional
+from confluent_kafka import Consumer, Message, TopicPartition
 from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.database import SessionLocal
+from app.events.codec import content_type_from_headers, decode
+from app.events.motorcycle_events import MOTORCYCLE_CREATED
 from app.messaging.handlers import handle_motorcycle_created
 
+logger = logging.getLogger("kafka_consumer")
+
+# Batch handlers: (sync session, events of one type) -> rows written.
+HANDLERS = {
+    MOTORCYCLE_CREATED: handle_motorcycle_created
+}
+
+class ConsumerMetrics:
+
+    def __init__(self):
+        self.batches = 0
+        self.messages = 0
+        self.rows_written = 0
+        self.skipped = 0
+        self.failures = 0
+        self.last_batch_size = 0
+        self._lock = threading.Lock()
+
+    def on_batch(self, messages: int, rows_written: int, skipped: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.messages += messages
+            self.rows_written += rows_written
+            self.skipped += skipped
+            self.last_batch_size = messages
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "messages": self.messages,
+                "rows_written": self.rows_written,
+                "skipped": self.skipped,
+                "failures": self.failures,
+                "last_batch_size": self.last_batch_size
+            }
+
+consumer_metrics = ConsumerMetrics()
+
+register_metrics("kafka_consumer", consumer_metrics.stats)
+
+def _decode(msg: Message) -> Optional[dict]:
+    try:
+        event = decode(msg.value(), content_type_from_headers(msg.headers()))
+        if not isinstance(event, dict):
+            raise ValueError(f"expected an event object, got {type(event).__name__}")
+        return event
+    except Exception as e:
+        # A poison message would otherwise block its partition forever.
+        logger.error("Skipping undecodable message %s[%d]@%d: %s", msg.topic(), msg.partition(), msg.offset(), e)
+        return None
+
+def _process_batch(messages: list[Message]) -> None:
+    events_by_type = defaultdict(list)
+    skipped = 0
+
+    for msg in messages:
+        event = _decode(msg)
+
+        if event is None or event.get("type") not in HANDLERS:
+            skipped += 1
+            continue
+        events_by_type[event["type"]].append(event)
+
+    rows_written = 0
+    db = SessionLocal()
+
+    try:
+        for event_type, events in events_by_type.items():
+            rows_written += HANDLERS[event_type](db, events)
+        db.commit()
+
+    except Exception:
+        db.rollback()
+        raise
+
+    finally:
+        db.close()
+
+    consumer_metrics.on_batch(len(messages), rows_written, skipped)
+
+def _rewind(consumer: Consumer, messages: list[Message]) -> None:
+    # Back to the first message of the failed batch on every partition, so the
+    # next consume() redelivers it.
+    first_offsets = {}
+    for msg in messages:
+        key = (msg.topic(), msg.partition())
+        first_offsets[key] = min(first_offsets.get(key, msg.offset()), msg.offset())
+
+    for (topic, partition), offset in first_offsets.items():
+        consumer.seek(TopicPartition(topic, partition, offset))
+
 def _consumer_loop():
     consumer = Consumer(
         {
             "bootstrap.servers": settings.KAFKA_BOOTSTRAP_SERVERS,
             "group.id": settings.KAFKA_CONSUMER_GROUP,
             "auto.offset.reset": "earliest",
-            "enable.auto.commit": True
+            # Offsets are committed by hand once the batch is in the database.
+            "enable.auto.commit": False
         }
     )
 
@@ -19,25 +123,53 @@ def _consumer_loop():
     try: 
         while True:
 
-            msg = consumer.poll(1.0)
+            messages = consumer.consume(
+                num_messages = settings.KAFKA_CONSUMER_BATCH_SIZE,
+                timeout = settings.KAFKA_CONSUMER_BATCH_TIMEOUT_SECONDS
+            )
 
-            if msg is None:
+            if not messages:
                 continue
 
-            if msg.error():
-                print(f"[KAFKA ERROR] {msg.error()}")
+            batch = []
+            for msg in messages:
+                if msg.error():
+                    logger.error("Kafka error: %s", msg.error())
+                    continue
+                batch.append(msg)
+
+            if not batch:
                 continue
 
-            event = json.loads(msg.value().decode("utf-8"))
-            handle_motorcycle_created(event)
+            try:
+                _process_batch(batch)
+            except Exception as e:
+                consumer_metrics.on_failure()
+                logger.error("Failed to process a batch of %d messages, retrying: %s", len(batch), e)
+
+                try:
+                    _rewind(consumer, batch)
+                except Exception as seek_error:
+                    # After a rebalance the partitions may be gone; their new
+                    # owner resumes from the last committed offset anyway.
+                    logger.warning("Could not rewind the failed batch: %s", seek_error)
+
+                time.sleep(settings.KAFKA_CONSUMER_RETRY_DELAY_SECONDS)
+                continue
+
+            try:
+                consumer.commit(asynchronous = False)
+            except Exception as e:
+                # The batch is stored; redelivery is absorbed by ON CONFLICT (vin).
+                logger.warning("Offset commit failed: %s", e)
+
+    except Exception:
+        logger.exception("Motorcycle consumer stopped")
 
-    except Exception as e:
-        print(f"[CONSUMER ERROR] {e}")
-    
     finally:
         consumer.close()
 
 
 def start_motorcycle_consumer() -> None:
     thread = threading.Thread(target = _consumer_loop, daemon = True)
-    thread.start()
\ No newline at end of file
+    thread.start()
@@ -1,33 +1,50 @@
 import logging
-from app.database import SessionLocal
-from app.models.motorcycle_notification import MotorcycleNotification
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.events.motorcycle_events import MOTORCYCLE_CREATED_VERSION
+from app.repositories.motorcycle_notification_repository import MotorcycleNotificationRepository
 
 logger = logging.getLogger("motorcycle_notifications")
 
-def handle_motorcycle_created(event: dict) -> None:
-    year = int(event.get("year", 0))
-    
-    if year == 2024:
-        notify_motorcycle_2024(event)
-
-def notify_motorcycle_2024(event: dict) -> None:
-    logger.info(
-        "Motorcycle 2024 detected | id = %s model = %s",
-        event["motorcycle_id"],
-        event["model"]
-    )
-
-    db = SessionLocal()
-
-    try: 
-        notification = MotorcycleNotification(
-            motorcycle_id = event["motorcycle_id"],
-            model = event["model"],
-            year = event["year"],
-            vin = event["vin"]
+def _notification(event: dict) -> Optional[dict]:
+    # A malformed event is logged and dropped: raising would fail the whole
+    # batch and redeliver it forever, blocking the partition.
+    try:
+        if event["version"] > MOTORCYCLE_CREATED_VERSION:
+            logger.warning("Skipping %s event with unsupported version %s", event["type"], event["version"])
+            return None
+
+        data = event["data"]
+        notification = {
+            "motorcycle_id": int(data["motorcycle_id"]),
+            "model": str(data["model"]),
+            "year": int(data["year"]),
+            "vin": str(data["vin"])
+        }
+
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error("Skipping malformed %s event: %r (%s)", event.get("type"), event, e)
+        return None
+
+    return notification
+
+def handle_motorcycle_created(db: Session, events: list[dict]) -> int:
+    notifications = {}
+    received_at = datetime.now(timezone.utc)
+
+    for event in events:
+        notification = _notification(event)
+
+        if notification is None or notification["year"] != 2024:
+            continue
+
+        logger.info(
+            "Motorcycle 2024 detected | id = %s model = %s",
+            notification["motorcycle_id"],
+            notification["model"]
         )
-        db.add(notification)
-        db.commit()
+        # Last event per VIN wins within a batch; ON CONFLICT handles earlier batches.
+        notifications[notification["vin"]] = {**notification, "received_at": received_at}
 
-    finally:
-        db.close()
\ No newline at end of file
+    return MotorcycleNotificationRepository.insert_many(db, list(notifications.values()))
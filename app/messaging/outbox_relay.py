@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from app.core.config import settings
+from app.core.kafka import KafkaProducer
+from app.core.metrics import register_metrics
+from app.core.pg_listener import pg_listener
+from app.core.unit_of_work import UnitOfWork
+from app.repositories.outbox_repository import OUTBOX_CHANNEL, OutboxRepository
+
+logger = logging.getLogger("outbox_relay")
+
+# Only one relay publishes at a time, across workers and processes, so
+# events leave in the order they were committed.
+RELAY_LOCK_ID = 0x6F7574626F78
+
+class OutboxRelay:
+
+    def __init__(self, batch_size: int, poll_interval: float, retention: int, purge_interval: float, purge_batch_size: int, retry_delay: float = 3):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.purge_interval = purge_interval
+        self.purge_batch_size = purge_batch_size
+        self.retry_delay = retry_delay
+        self.relayed = 0
+        self.purged = 0
+        self._next_purge_at = 0.0
+        self.batches = 0
+        self.failures = 0
+        self.last_relay_at: Optional[float] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def on_notification(self, payload: Optional[str]) -> None:
+        self._wakeup.set()
+
+    async def relay_batch(self) -> int:
+        async with UnitOfWork() as uow:
+            if not await OutboxRepository.try_lock_relay(uow.session, RELAY_LOCK_ID):
+                return 0
+
+            events = await OutboxRepository.list_pending(uow.session, self.batch_size)
+            if not events:
+                return 0
+
+            # Rows are marked sent only after Kafka acknowledged the whole batch;
+            # a crash in between re-publishes it (at-least-once).
+            await KafkaProducer.send_batch_and_wait([(event.topic, event.key, event.payload) for event in events])
+            await OutboxRepository.mark_sent(uow.session, [event.id for event in events])
+            await uow.commit()
+
+        self.relayed += len(events)
+        self.batches += 1
+        self.last_relay_at = time.time()
+        return len(events)
+
+    async def drain(self) -> None:
+        while await self.relay_batch() == self.batch_size:
+            pass
+
+    async def purge(self) -> None:
+        # Chunked so a backlog left by large imports never holds one huge delete open.
+        while True:
+            async with UnitOfWork() as uow:
+                deleted = await OutboxRepository.purge_sent(uow.session, self.retention, self.purge_batch_size)
+                await uow.commit()
+
+            self.purged += deleted
+            if deleted < self.purge_batch_size:
+                return
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.drain()
+
+                if time.monotonic() >= self._next_purge_at:
+                    await self.purge()
+                    self._next_purge_at = time.monotonic() + self.purge_interval
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.warning("Outbox relay failed, retrying: %s", e)
+                await asyncio.sleep(self.retry_delay)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "relayed": self.relayed,
+            "batches": self.batches,
+            "failures": self.failures,
+            "purged": self.purged,
+            "last_relay_at": self.last_relay_at
+        }
+
+outbox_relay = OutboxRelay(
+    batch_size = settings.OUTBOX_BATCH_SIZE,
+    poll_interval = settings.OUTBOX_POLL_INTERVAL_SECONDS,
+    retention = settings.OUTBOX_RETENTION_SECONDS,
+    purge_interval = settings.OUTBOX_PURGE_INTERVAL_SECONDS,
+    purge_batch_size = settings.OUTBOX_PURGE_BATCH_SIZE
+)
+
+pg_listener.subscribe(OUTBOX_CHANNEL, outbox_relay.on_notification)
+register_metrics("outbox_relay", outbox_relay.stats)
+
+async def _run_standalone() -> None:
+    await KafkaProducer.start()
+    pg_listener.start()
+
+    try:
+        await outbox_relay.run()
+    finally:
+        await pg_listener.stop()
+        await KafkaProducer.stop()
+
+if __name__ == "__main__":
+    # Dedicated relay process; set OUTBOX_RELAY_ENABLED=false on the API workers.
+    asyncio.run(_run_standalone())
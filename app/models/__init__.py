@@ -2,4 +2,7 @@ from .user import User
 from .motorcycle import Motorcycle
 from .rental import Rental
 from .rental_plan import RentalPlan
-from .motorcycle_notification import MotorcycleNotification
\ No newline at end of file
+from .motorcycle_notification import MotorcycleNotification
+from .rate_limit_bucket import RateLimitBucket
+from .revoked_token import RevokedToken
+from .outbox_event import OutboxEvent
\ No newline at end of file
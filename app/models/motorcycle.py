@@ -1,10 +1,26 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, text, true
 from app.database import Base
 
 class Motorcycle(Base):
     __tablename__ = "motorcycles"
+    __table_args__ = (
+        Index(
+            "ix_motorcycles_available",
+            "id",
+            postgresql_where = text("is_available"),
+            postgresql_include = ["model", "year", "vin"]
+        ),
+    )
 
     id = Column(Integer, primary_key = True, index = True)
     model = Column(String, nullable = False)
     year = Column(Integer, nullable = False)
-    vin = Column(String, unique = True, index = True, nullable = False)
\ No newline at end of file
+    vin = Column(String, unique = True, index = True, nullable = False)
+
+    # Maintained by RentalRepository in the same transaction as the rental itself.
+    current_rental_id = Column(
+        Integer,
+        ForeignKey("rentals.id", use_alter = True, name = "fk_motorcycles_current_rental_id"),
+        nullable = True
+    )
+    is_available = Column(Boolean, nullable = False, default = True, server_default = true())
@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.database import Base
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # The relay only ever scans unsent rows in id order.
+        Index("ix_outbox_events_pending", "id", postgresql_where = text("sent_at IS NULL")),
+    )
+
+    id = Column(BigInteger, primary_key = True)
+    topic = Column(String(255), nullable = False)
+    key = Column(String(255), nullable = True)
+    payload = Column(JSONB, nullable = False)
+    created_at = Column(DateTime(timezone = True), nullable = False, server_default = func.now())
+    sent_at = Column(DateTime(timezone = True), nullable = True)
@@ -0,0 +1,10 @@
+from sqlalchemy import Boolean, Column, DateTime, Float, String
+from app.database import Base
+
+class RateLimitBucket(Base):
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(255), primary_key = True)
+    tokens = Column(Float, nullable = False)
+    allowed = Column(Boolean, nullable = False, default = True)
+    updated_at = Column(DateTime(timezone = True), nullable = False)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String, text
 from datetime import datetime, timezone
 
 from app.database import Base
 
 class Rental(Base):
     __tablename__ = 'rentals'
+    __table_args__ = (
+        Index("uq_rentals_active_motorcycle_id", "motorcycle_id", unique = True, postgresql_where = text("status = 'active'")),
+        Index("ix_rentals_user_id_start_date", "user_id", "start_date"),
+    )
 
     id = Column(Integer, primary_key = True, index = True) 
 
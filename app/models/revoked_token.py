@@ -0,0 +1,11 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from datetime import datetime, timezone
+from app.database import Base
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(64), primary_key = True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable = False)
+    expires_at = Column(DateTime(timezone = True), nullable = False, index = True)
+    revoked_at = Column(DateTime(timezone = True), default = lambda: datetime.now(timezone.utc))
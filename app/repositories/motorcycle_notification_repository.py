@@ -0,0 +1,20 @@
+from typing import List
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.models.motorcycle_notification import MotorcycleNotification
+
+class MotorcycleNotificationRepository:
+
+    @staticmethod
+    def insert_many(db: Session, values: List[dict]) -> int:
+        if not values:
+            return 0
+
+        # Redelivered events hit the unique VIN index and are skipped.
+        stmt = (
+            insert(MotorcycleNotification)
+            .values(values)
+            .on_conflict_do_nothing(index_elements = [MotorcycleNotification.vin])
+            .returning(MotorcycleNotification.id)
+        )
+        return len(db.execute(stmt).all())
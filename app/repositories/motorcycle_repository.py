@@ -1,53 +1,73 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, exists, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from app.models.motorcycle import Motorcycle
-from sqlalchemy import exists
 from app.models.rental import Rental
 from typing import Optional, List
 
 class MotorcycleRepository:
 
     @staticmethod
-    def create(db: Session, motorcycle: Motorcycle) -> Motorcycle:
+    async def create(db: AsyncSession, motorcycle: Motorcycle) -> Motorcycle:
         db.add(motorcycle)
-        db.commit()
-        db.refresh(motorcycle)
+        await db.flush()
         return motorcycle
     
     @staticmethod
-    def get_by_id(db: Session, motorcycle_id: int) -> Optional[Motorcycle]: 
-        return db.query(Motorcycle).filter(Motorcycle.id == motorcycle_id).first()
+    async def insert_many(db: AsyncSession, values: List[dict]) -> List[Row]:
+        # Rows whose VIN already exists are skipped and simply not returned.
+        stmt = (
+            insert(Motorcycle)
+            .values(values)
+            .on_conflict_do_nothing(index_elements = [Motorcycle.vin])
+            .returning(Motorcycle.id, Motorcycle.model, Motorcycle.year, Motorcycle.vin)
+        )
+        return (await db.execute(stmt)).all()
     
     @staticmethod
-    def get_by_vin(db: Session, vin: str) -> Motorcycle:
-        return db.query(Motorcycle).filter(Motorcycle.vin == vin).first()
+    async def get_by_id(db: AsyncSession, motorcycle_id: int) -> Optional[Motorcycle]: 
+        return await db.scalar(select(Motorcycle).where(Motorcycle.id == motorcycle_id))
     
     @staticmethod
-    def list_all(db: Session) -> List[Motorcycle]:
-        return db.query(Motorcycle).all()
+    async def get_by_vin(db: AsyncSession, vin: str) -> Motorcycle:
+        return await db.scalar(select(Motorcycle).where(Motorcycle.vin == vin))
+    
+    @staticmethod
+    async def list_all(db: AsyncSession, after_id: Optional[int], limit: int) -> List[Motorcycle]:
+        stmt = select(Motorcycle)
+
+        if after_id is not None:
+            stmt = stmt.where(Motorcycle.id > after_id)
+
+        return (await db.scalars(stmt.order_by(Motorcycle.id).limit(limit + 1))).all()
 
     @staticmethod
-    def list_available(db: Session) -> List[Motorcycle]:
-        return db.query(Motorcycle).filter(
-                                            ~exists().where(
-                                                            (Rental.motorcycle_id == Motorcycle.id) &
-                                                            (Rental.status == "active")
-                                                            )
-                                            ).all()
+    async def list_available(db: AsyncSession) -> List[Row]:
+        # Only the columns ix_motorcycles_available covers, so Postgres can
+        # answer from the index without touching the heap.
+        return (await db.execute(
+            select(Motorcycle.id, Motorcycle.model, Motorcycle.year, Motorcycle.vin)
+            .where(Motorcycle.is_available)
+            .order_by(Motorcycle.id)
+        )).all()
 
     @staticmethod
-    def update_vin(db: Session, motorcycle: Motorcycle, vin: str) -> Motorcycle:
+    async def update_vin(db: AsyncSession, motorcycle: Motorcycle, vin: str) -> Motorcycle:
         motorcycle.vin = vin
-        db.commit()
-        db.refresh(motorcycle)
+        await db.flush()
         return motorcycle
 
     @staticmethod
-    def delete(db: Session, motorcycle: Motorcycle) -> None:
-        db.delete(motorcycle)
-        db.commit()
+    async def delete(db: AsyncSession, motorcycle: Motorcycle) -> None:
+        await db.delete(motorcycle)
+        await db.flush()
+
+    @staticmethod
+    async def has_rentals(db: AsyncSession, motorcylce_id: int) -> bool:
+        return await db.scalar(select(exists().where(Rental.motorcycle_id == motorcylce_id)))
 
     @staticmethod
-    def has_rentals(db: Session, motorcylce_id: int) -> bool:
-        return db.query(exists().where(Rental.motorcycle_id == motorcylce_id)).scalar()
+    async def stream_for_export(db: AsyncSession, batch_size: int) -> AsyncResult:
+        stmt = select(*Motorcycle.__table__.columns).order_by(Motorcycle.id)
 
-        
\ No newline at end of file
+        return await db.stream(stmt.execution_options(yield_per = batch_size))
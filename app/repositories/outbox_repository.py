@@ -0,0 +1,62 @@
+from typing import Optional
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.outbox_event import OutboxEvent
+
+OUTBOX_CHANNEL = "outbox_events"
+
+class OutboxRepository:
+
+    @staticmethod
+    async def add_many(db: AsyncSession, topic: str, messages: list[tuple[Optional[str], dict]]) -> None:
+        if not messages:
+            return
+
+        await db.execute(
+            insert(OutboxEvent),
+            [{"topic": topic, "key": key, "payload": payload} for key, payload in messages]
+        )
+        # Delivered with the commit, so the relay wakes up exactly when the rows become visible.
+        await db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": OUTBOX_CHANNEL})
+
+    @staticmethod
+    async def add(db: AsyncSession, topic: str, payload: dict, key: Optional[str] = None) -> None:
+        await OutboxRepository.add_many(db, topic, [(key, payload)])
+
+    @staticmethod
+    async def try_lock_relay(db: AsyncSession, lock_id: int) -> bool:
+        return await db.scalar(select(func.pg_try_advisory_xact_lock(lock_id)))
+
+    @staticmethod
+    async def list_pending(db: AsyncSession, limit: int) -> list[OutboxEvent]:
+        return (await db.scalars(
+            select(OutboxEvent).where(OutboxEvent.sent_at.is_(None)).order_by(OutboxEvent.id).limit(limit)
+        )).all()
+
+    @staticmethod
+    async def mark_sent(db: AsyncSession, ids: list[int]) -> None:
+        await db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(ids))
+            .values(sent_at = func.now())
+            .execution_options(synchronize_session = False)
+        )
+
+    @staticmethod
+    async def purge_sent(db: AsyncSession, older_than_seconds: int, limit: int) -> int:
+        # Rows are sent in id order, so the oldest sent rows sit at the start of the primary key.
+        expired = (
+            select(OutboxEvent.id)
+            .where(
+                OutboxEvent.sent_at.is_not(None),
+                OutboxEvent.sent_at < func.now() - func.make_interval(0, 0, 0, 0, 0, 0, older_than_seconds)
+            )
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+        )
+        result = await db.execute(
+            delete(OutboxEvent)
+            .where(OutboxEvent.id.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session = False)
+        )
+        return result.rowcount
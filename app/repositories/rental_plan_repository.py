@@ -1,12 +1,21 @@
-from sqlalchemy.orm import Session
+from decimal import Decimal
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.rental_plan import RentalPlan
 
 class RentalPlanRepository:
 
     @staticmethod
-    def get_by_days(db: Session, days: int) -> RentalPlan:
-        return db.query(RentalPlan).filter(RentalPlan.days == days).first()
-    
+    async def list_all(db: AsyncSession) -> list[RentalPlan]:
+        return (await db.scalars(select(RentalPlan))).all()
+
     @staticmethod
-    def list_all(db: Session) -> list[RentalPlan]:
-        return db.query(RentalPlan).all()
+    async def upsert(db: AsyncSession, days: int, price_per_day: Decimal) -> RentalPlan:
+        stmt = (
+            insert(RentalPlan)
+            .values(days = days, price_per_day = price_per_day)
+            .on_conflict_do_update(index_elements = [RentalPlan.days], set_ = {"price_per_day": price_per_day})
+            .returning(RentalPlan)
+        )
+        return await db.scalar(stmt.execution_options(populate_existing = True))
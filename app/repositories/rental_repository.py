@@ -1,39 +1,80 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, select, update
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from app.models.rental import Rental
+from app.models.motorcycle import Motorcycle
+from app.models.user import User
+from datetime import date
 from typing import Optional
 
 class RentalRepository:
 
     @staticmethod
-    def create(db: Session, rental: Rental) -> Rental:
+    async def create(db: AsyncSession, rental: Rental) -> Rental:
         db.add(rental)
-        db.commit()
-        db.refresh(rental)
+        await db.flush()
+        await db.execute(
+            update(Motorcycle)
+            .where(Motorcycle.id == rental.motorcycle_id)
+            .values(current_rental_id = rental.id, is_available = False)
+        )
         return rental
 
     @staticmethod
-    def get_by_id(db: Session, rental_id: int) -> Optional[Rental]:
-        return db.query(Rental).filter(Rental.id == rental_id).first()
+    async def get_booking_context(db: AsyncSession, user_id: int, motorcycle_id: int) -> Optional[Row]:
+        # One round trip for everything a booking is validated against in the
+        # database. A missing motorcycle comes back as NULL columns; a missing user as no row.
+        return (await db.execute(
+            select(
+                User.cnh_type,
+                Motorcycle.id.label("motorcycle_id"),
+                Motorcycle.is_available
+            )
+            .select_from(User)
+            .outerjoin(Motorcycle, Motorcycle.id == motorcycle_id)
+            .where(User.id == user_id)
+        )).first()
 
     @staticmethod
-    def list_all(db: Session) -> list[Rental]:
-        return db.query(Rental).all()
+    async def get_by_id(db: AsyncSession, rental_id: int) -> Optional[Rental]:
+        return await db.scalar(select(Rental).where(Rental.id == rental_id))
+
+    @staticmethod
+    async def _page(db: AsyncSession, stmt, after_id: Optional[int], limit: int) -> list[Rental]:
+        if after_id is not None:
+            stmt = stmt.where(Rental.id > after_id)
+
+        return (await db.scalars(stmt.order_by(Rental.id).limit(limit + 1))).all()
+
+    @staticmethod
+    async def list_all(db: AsyncSession, after_id: Optional[int], limit: int) -> list[Rental]:
+        return await RentalRepository._page(db, select(Rental), after_id, limit)
     
     @staticmethod
-    def list_by_motorcycle(db: Session, motorcycle_id: int) -> list[Rental]:
-        return db.query(Rental).filter(Rental.motorcycle_id == motorcycle_id).all()
+    async def list_by_motorcycle(db: AsyncSession, motorcycle_id: int, after_id: Optional[int], limit: int) -> list[Rental]:
+        return await RentalRepository._page(db, select(Rental).where(Rental.motorcycle_id == motorcycle_id), after_id, limit)
     
     @staticmethod
-    def list_by_user(db: Session, user_id: int) -> list[Rental]:
-        return db.query(Rental).filter(Rental.user_id == user_id).all()
+    async def list_by_user(db: AsyncSession, user_id: int, after_id: Optional[int], limit: int) -> list[Rental]:
+        return await RentalRepository._page(db, select(Rental).where(Rental.user_id == user_id), after_id, limit)
 
     @staticmethod
-    def has_active_rental(db: Session, motorcycle_id: int) -> Optional[Rental]:
-        return db.query(Rental).filter(Rental.motorcycle_id == motorcycle_id, Rental.status == "active").first()
+    async def finished(db: AsyncSession, rental: Rental) -> Rental:
+        db.add(rental)
+        await db.flush()
+        await db.execute(
+            update(Motorcycle)
+            .where(Motorcycle.id == rental.motorcycle_id, Motorcycle.current_rental_id == rental.id)
+            .values(current_rental_id = None, is_available = True)
+        )
+        return rental
 
     @staticmethod
-    def finished(db: Session, rental: Rental) -> Rental:
-        db.add(rental)
-        db.commit()
-        db.refresh(rental)
-        return rental
\ No newline at end of file
+    async def stream_for_export(db: AsyncSession, start_date_from: Optional[date], start_date_to: Optional[date], batch_size: int) -> AsyncResult:
+        stmt = select(*Rental.__table__.columns)
+
+        if start_date_from is not None:
+            stmt = stmt.where(Rental.start_date >= start_date_from)
+        if start_date_to is not None:
+            stmt = stmt.where(Rental.start_date <= start_date_to)
+
+        return await db.stream(stmt.order_by(Rental.id).execution_options(yield_per = batch_size))
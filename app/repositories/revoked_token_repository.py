@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.revoked_token import RevokedToken
+
+class RevokedTokenRepository:
+
+    @staticmethod
+    async def revoke(db: AsyncSession, jti: str, user_id: int, expires_at: datetime) -> RevokedToken:
+        revoked = RevokedToken(jti = jti, user_id = user_id, expires_at = expires_at)
+        db.add(revoked)
+        await db.flush()
+        return revoked
+
+    @staticmethod
+    async def list_active(db: AsyncSession) -> list[tuple[str, datetime]]:
+        return (await db.execute(
+            select(RevokedToken.jti, RevokedToken.expires_at).where(
+                RevokedToken.expires_at > datetime.now(timezone.utc)
+            )
+        )).all()
+
+    @staticmethod
+    async def delete_expired(db: AsyncSession) -> int:
+        result = await db.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(timezone.utc))
+        )
+        return result.rowcount
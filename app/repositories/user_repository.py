@@ -1,35 +1,47 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
+from app.core.unit_of_work import on_commit
+from app.core.user_cache import user_cache
 
 class UserRepository:
 
     @staticmethod
-    def create(db: Session, user: User) -> User:
+    async def create(db: AsyncSession, user: User) -> User:
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.flush()
+        on_commit(db, lambda: user_cache.invalidate(user.id))
         return user
 
     @staticmethod
-    def get_by_email(db: Session, email: str) -> User:
-        return db.query(User).filter(User.email == email).first()
+    async def get_by_email(db: AsyncSession, email: str) -> User:
+        return await db.scalar(select(User).where(User.email == email))
 
     @staticmethod
-    def get_by_cnpj(db: Session, cnpj: str) -> User:
-        return db.query(User).filter(User.cnpj == cnpj).first()
+    async def get_by_id(db: AsyncSession, user_id: int) -> User:
+        return await db.scalar(select(User).where(User.id == user_id))
 
     @staticmethod
-    def get_by_cnh(db: Session, cnh_number: str) -> User:
-        return db.query(User).filter(User.cnh_number == cnh_number).first()
+    async def update_cnh_photo(db: AsyncSession, user: User, photo_path: str) -> User:
+        user.cnh_photo_path = photo_path
+        await db.flush()
+        on_commit(db, lambda: user_cache.invalidate(user.id))
+        return user
 
     @staticmethod
-    def get_by_id(db: Session, user_id: int) -> User:
-        return db.query(User).filter(User.id == user_id).first()
+    async def find_existing(db: AsyncSession, emails: list[str], cnpjs: list[str], cnh_numbers: list[str]) -> list[Row]:
+        return (await db.execute(
+            select(User.email, User.cnpj, User.cnh_number).where(or_(
+                User.email.in_(emails),
+                User.cnpj.in_(cnpjs),
+                User.cnh_number.in_(cnh_numbers)
+            ))
+        )).all()
 
     @staticmethod
-    def update_cnh_photo(db: Session, user: User, photo_path: str) -> User:
-        user.cnh_photo_path = photo_path
-        db.commit()
-        db.refresh(user)
-        return user
-    
\ No newline at end of file
+    async def insert_many(db: AsyncSession, values: list[dict]) -> list[Row]:
+        # Rows that hit any unique index are skipped and simply not returned.
+        return (await db.execute(
+            insert(User).values(values).on_conflict_do_nothing().returning(User.id, User.email)
+        )).all()
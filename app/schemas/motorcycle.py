@@ -1,3 +1,4 @@
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 class MotorcycleBase(BaseModel):
@@ -15,4 +16,16 @@ class MotorcycleResponse(MotorcycleBase):
     id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class MotorcycleImportError(BaseModel):
+    row: int
+    vin: Optional[str] = None
+    error: str
+    message: str
+
+class MotorcycleImportReport(BaseModel):
+    total: int
+    imported: int
+    failed: int
+    errors: List[MotorcycleImportError]
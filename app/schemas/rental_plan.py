@@ -0,0 +1,12 @@
+from decimal import Decimal
+from pydantic import BaseModel, Field
+
+class RentalPlanResponse(BaseModel):
+    days: int
+    price_per_day: float
+
+    class Config:
+        from_attributes = True
+
+class RentalPlanUpdate(BaseModel):
+    price_per_day: Decimal = Field(..., gt=0, max_digits=10, decimal_places=2)
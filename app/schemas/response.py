@@ -6,4 +6,5 @@ T = TypeVar('T')
 class SucessResponse(BaseModel, Generic[T]):
     sucess: bool = True
     message: str
-    data: Optional[T] = None
\ No newline at end of file
+    data: Optional[T] = None
+    next_cursor: Optional[str] = None
\ No newline at end of file
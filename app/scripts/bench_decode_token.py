@@ -0,0 +1,21 @@
+import timeit
+from app.core.jwt import create_access_token, decode_token, _verify_token, verified_tokens
+
+ITERATIONS = 20000
+
+def bench():
+    token = create_access_token(1, "user")
+
+    uncached = timeit.timeit(lambda: _verify_token(token), number = ITERATIONS)
+
+    verified_tokens.clear()
+    decode_token(token)
+    cached = timeit.timeit(lambda: decode_token(token), number = ITERATIONS)
+
+    print(f"iterations:      {ITERATIONS}")
+    print(f"uncached decode: {uncached / ITERATIONS * 1e6:.2f} us/op")
+    print(f"cached decode:   {cached / ITERATIONS * 1e6:.2f} us/op")
+    print(f"speedup:         {uncached / cached:.1f}x")
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,41 @@
+import gzip
+import timeit
+from app.events.codec import ENCODINGS, decode, encode, envelope
+from app.events.motorcycle_events import MOTORCYCLE_CREATED, MOTORCYCLE_CREATED_VERSION
+
+ITERATIONS = 20000
+# Roughly one producer batch, to compare sizes after the producer's gzip.
+BATCH = 500
+
+def _sample_event(i: int) -> dict:
+    return envelope(MOTORCYCLE_CREATED, MOTORCYCLE_CREATED_VERSION, {
+        "motorcycle_id": 100000 + i,
+        "model": "Honda CG 160",
+        "vin": f"ABC{i % 10}D{i % 100:02d}",
+        "year": 2024
+    })
+
+def bench():
+    event = _sample_event(1)
+    batch = [_sample_event(i) for i in range(BATCH)]
+
+    print(f"iterations: {ITERATIONS}, batch: {BATCH}")
+    print(f"{'encoding':<10}{'encode us/op':>14}{'decode us/op':>14}{'bytes/event':>13}{'gzip bytes/event':>18}")
+
+    for name, content_type in ENCODINGS.items():
+        value = encode(event, content_type)
+
+        encode_time = timeit.timeit(lambda: encode(event, content_type), number = ITERATIONS)
+        decode_time = timeit.timeit(lambda: decode(value, content_type), number = ITERATIONS)
+
+        encoded = [encode(item, content_type) for item in batch]
+        raw_size = sum(len(item) for item in encoded) / BATCH
+        gzip_size = len(gzip.compress(b"".join(encoded))) / BATCH
+
+        print(
+            f"{name:<10}{encode_time / ITERATIONS * 1e6:>14.2f}{decode_time / ITERATIONS * 1e6:>14.2f}"
+            f"{raw_size:>13.1f}{gzip_size:>18.1f}"
+        )
+
+if __name__ == "__main__":
+    bench()
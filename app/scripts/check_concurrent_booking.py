@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import sys
+import uuid
+from datetime import date, timedelta
+from sqlalchemy import delete, update
+from app.core.exceptions import AppException
+from app.core.unit_of_work import UnitOfWork
+from app.database import AsyncSessionLocal, async_engine
+from app.models.motorcycle import Motorcycle
+from app.models.rental import Rental
+from app.models.user import User
+from app.schemas.rental import RentalCreate
+from app.scripts.seed_rental_plans import seed
+from app.services.rental_service import RentalService
+
+PLAN_DAYS = 7
+
+async def _book(user_id: int, payload: RentalCreate):
+    async with UnitOfWork() as uow:
+        try:
+            rental = await RentalService.register(uow.session, user_id, payload)
+            await uow.commit()
+            return rental
+        except AppException as e:
+            return e.error
+
+async def check(bookings: int) -> bool:
+    suffix = uuid.uuid4().hex[:8]
+
+    async with AsyncSessionLocal() as db:
+        user = User(name = "booking-check", email = f"booking-check-{suffix}@example.com", password = "x", cnh_type = "A")
+        motorcycle = Motorcycle(model = "booking-check", year = 2024, vin = f"BKC-{suffix}")
+        db.add_all([user, motorcycle])
+        await db.commit()
+
+    start = date.today()
+    payload = RentalCreate(
+        motorcycle_id = motorcycle.id,
+        plan_days = PLAN_DAYS,
+        start_date = start,
+        expected_end_date = start + timedelta(days = PLAN_DAYS)
+    )
+
+    try:
+        results = await asyncio.gather(*(_book(user.id, payload) for _ in range(bookings)))
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(update(Motorcycle).where(Motorcycle.id == motorcycle.id).values(current_rental_id = None))
+            await db.execute(delete(Rental).where(Rental.motorcycle_id == motorcycle.id))
+            await db.execute(delete(Motorcycle).where(Motorcycle.id == motorcycle.id))
+            await db.execute(delete(User).where(User.id == user.id))
+            await db.commit()
+
+        await async_engine.dispose()
+
+    booked = [r for r in results if isinstance(r, Rental)]
+    errors = [r for r in results if not isinstance(r, Rental)]
+    unexpected = [e for e in errors if e != "MOTORCYCLE_ALREADY_RENTED"]
+
+    print(f"{bookings} parallel bookings: {len(booked)} succeeded, {len(errors)} rejected")
+    if unexpected:
+        print(f"unexpected errors: {sorted(set(unexpected))}")
+
+    return len(booked) == 1 and not unexpected
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Fire parallel bookings for one motorcycle and expect exactly one to win.")
+    parser.add_argument("-n", "--bookings", type = int, default = 20)
+    args = parser.parse_args()
+
+    seed()
+    sys.exit(0 if asyncio.run(check(args.bookings)) else 1)
@@ -0,0 +1,103 @@
+import json
+import sys
+from sqlalchemy import text
+from app.database import engine
+
+USERS = 20000
+MOTORCYCLES = 50000
+RENTALS = 500000
+
+SEED = [
+    text("""
+        INSERT INTO users (name, email, password, role)
+        SELECT 'plan-check', 'plan-check-' || g || '@example.com', 'x', 'user'
+        FROM generate_series(1, :users) AS g
+    """),
+    text("""
+        INSERT INTO motorcycles (model, year, vin)
+        SELECT 'plan-check', 2024, 'PLN' || lpad(g::text, 8, '0')
+        FROM generate_series(1, :motorcycles) AS g
+    """),
+    # At most one active rental per motorcycle, as uq_rentals_active_motorcycle_id enforces.
+    text("""
+        INSERT INTO rentals (user_id, motorcycle_id, start_date, expected_end_date, status)
+        SELECT u.id, m.id, d, d + 7, CASE WHEN g % 100 = 0 AND g <= :motorcycles THEN 'active' ELSE 'finished' END
+        FROM generate_series(1, :rentals) AS g
+        CROSS JOIN LATERAL (SELECT current_date - (g % 700) AS d) AS dates
+        JOIN LATERAL (SELECT id FROM users WHERE email = 'plan-check-' || (g % :users + 1) || '@example.com') AS u ON true
+        JOIN LATERAL (SELECT id FROM motorcycles WHERE vin = 'PLN' || lpad((g % :motorcycles + 1)::text, 8, '0')) AS m ON true
+    """),
+    # Most of a busy fleet is out on rental at any given time.
+    text("UPDATE motorcycles SET is_available = (id % 50 = 0) WHERE model = 'plan-check'"),
+    text("ANALYZE users"),
+    text("ANALYZE motorcycles"),
+    text("ANALYZE rentals"),
+]
+
+# Each entry mirrors the statement issued by the repository method named in the key,
+# with the index the plan must use and, where it matters, the scan node type.
+CHECKS = {
+    "RentalRepository.list_by_user": (
+        """
+        SELECT * FROM rentals
+        WHERE rentals.user_id = (SELECT min(id) FROM users WHERE name = 'plan-check')
+        ORDER BY rentals.id
+        LIMIT 51
+        """,
+        "ix_rentals_user_id_start_date",
+        None,
+    ),
+    "MotorcycleRepository.list_available": (
+        """
+        SELECT motorcycles.id, motorcycles.model, motorcycles.year, motorcycles.vin
+        FROM motorcycles
+        WHERE motorcycles.is_available
+        ORDER BY motorcycles.id
+        """,
+        "ix_motorcycles_available",
+        "Index Only Scan",
+    ),
+}
+
+def _index_scans(plan: dict) -> set:
+    scans = {(plan["Node Type"], plan["Index Name"])} if "Index Name" in plan else set()
+
+    for child in plan.get("Plans", []):
+        scans |= _index_scans(child)
+    return scans
+
+def check() -> bool:
+    ok = True
+    params = {"users": USERS, "motorcycles": MOTORCYCLES, "rentals": RENTALS}
+
+    with engine.connect() as conn:
+        transaction = conn.begin()
+
+        try:
+            for statement in SEED:
+                conn.execute(statement, params)
+
+            for name, (sql, expected_index, expected_node) in CHECKS.items():
+                raw = conn.execute(text("EXPLAIN (FORMAT JSON) " + sql)).scalar()
+                plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+                scans = _index_scans(plan)
+
+                matched = any(
+                    index == expected_index and expected_node in (None, node)
+                    for node, index in scans
+                )
+                expected = f"{expected_node} on {expected_index}" if expected_node else expected_index
+                used = sorted(f"{node} on {index}" for node, index in scans)
+
+                status = "ok" if matched else "FAIL"
+                ok = ok and status == "ok"
+                print(f"[{status}] {name}: expected {expected}, plan uses {used or 'no index'}")
+
+        finally:
+            # Synthetic rows never leave this transaction.
+            transaction.rollback()
+
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if check() else 1)
@@ -0,0 +1,35 @@
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from app.core.security import bulk_password_hasher
+from app.database import async_engine
+from app.services.export_service import ExportFormat
+from app.services.import_file import parse_import_file
+from app.services.user_import_service import UserImportService
+
+async def run(path: Path, data_format: ExportFormat) -> int:
+    failed = 0
+
+    try:
+        records = parse_import_file(path.read_bytes(), data_format)
+
+        async for chunk in UserImportService.import_users(records):
+            sys.stdout.write(chunk)
+            failed += sum(json.loads(line)["status"] == "error" for line in chunk.splitlines())
+    finally:
+        bulk_password_hasher.shutdown()
+        await async_engine.dispose()
+
+    print(f"{len(records) - failed} of {len(records)} rider(s) imported.", file = sys.stderr)
+    return failed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Bulk import riders from a CSV or NDJSON file of UserCreate records.")
+    parser.add_argument("path", type = Path)
+    parser.add_argument("--format", type = ExportFormat, choices = list(ExportFormat), help = "Defaults to the file extension.")
+    args = parser.parse_args()
+
+    data_format = args.format or (ExportFormat.csv if args.path.suffix.lower() == ".csv" else ExportFormat.ndjson)
+    sys.exit(1 if asyncio.run(run(args.path, data_format)) else 0)
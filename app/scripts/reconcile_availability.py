@@ -0,0 +1,57 @@
+import argparse
+from sqlalchemy import text
+from app.database import engine
+
+# Recomputes motorcycles.current_rental_id / is_available from the rentals table
+# and reports (or fixes) every motorcycle whose maintained state has drifted.
+DRIFT = """
+    WITH active AS (
+        SELECT DISTINCT ON (motorcycle_id) motorcycle_id, id
+        FROM rentals
+        WHERE status = 'active'
+        ORDER BY motorcycle_id, id DESC
+    ),
+    expected AS (
+        SELECT m.id, active.id AS rental_id
+        FROM motorcycles m
+        LEFT JOIN active ON active.motorcycle_id = m.id
+    )
+"""
+
+FIND = text(DRIFT + """
+    SELECT m.id, m.current_rental_id, expected.rental_id AS expected_rental_id
+    FROM motorcycles m
+    JOIN expected ON expected.id = m.id
+    WHERE m.current_rental_id IS DISTINCT FROM expected.rental_id
+       OR m.is_available IS DISTINCT FROM (expected.rental_id IS NULL)
+    ORDER BY m.id
+""")
+
+REPAIR = text(DRIFT + """
+    UPDATE motorcycles m
+    SET current_rental_id = expected.rental_id,
+        is_available = expected.rental_id IS NULL
+    FROM expected
+    WHERE expected.id = m.id
+      AND (m.current_rental_id IS DISTINCT FROM expected.rental_id
+           OR m.is_available IS DISTINCT FROM (expected.rental_id IS NULL))
+    RETURNING m.id
+""")
+
+def reconcile(dry_run: bool) -> int:
+    with engine.begin() as conn:
+        if dry_run:
+            rows = conn.execute(FIND).all()
+            for row in rows:
+                print(f"motorcycle {row.id}: current_rental_id={row.current_rental_id} expected={row.expected_rental_id}")
+            return len(rows)
+
+        return len(conn.execute(REPAIR).all())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Reconcile maintained motorcycle availability with rentals.")
+    parser.add_argument("--dry-run", action = "store_true", help = "Only report drifted motorcycles.")
+    args = parser.parse_args()
+
+    count = reconcile(args.dry_run)
+    print(f"{count} motorcycle(s) {'drifted' if args.dry_run else 'repaired'}.")
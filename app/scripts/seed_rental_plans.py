@@ -1,3 +1,4 @@
+from sqlalchemy import text
 from app.database import SessionLocal
 from app.models.rental_plan import RentalPlan
 
@@ -15,7 +16,9 @@ def seed():
             exits = db.query(RentalPlan).filter_by(days = plan["days"]).first()
             if not exits:
                 db.add(RentalPlan(**plan))
-    
+
+        # Running API workers reload their rental plan catalog on this notification.
+        db.execute(text("SELECT pg_notify('rental_plans_changed', '')"))
         db.commit()
 
 if __name__ == "__main__":
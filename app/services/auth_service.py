@@ -1,17 +1,24 @@
-from sqlalchemy.orm import Session 
+from datetime import datetime, timezone
+from functools import partial
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import status
-from app.core.security import verify_password
+from app.core.security import verify_password_async
 from app.core.jwt import create_access_token, create_refresh_token, decode_token
 from app.core.exceptions import AppException
+from app.core.revocation import revocation_index
+from app.core.unit_of_work import on_commit
 from app.repositories.user_repository import UserRepository
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.services.user_service import UserService
 from app.schemas.auth import TokenResponse, LoginResponse
 
 class AuthService:
 
     @staticmethod
-    def login(db: Session, email: str, password: str) -> LoginResponse:
-        user = UserRepository.get_by_email(db, email)
-        if not user or not verify_password(password, user.password):
+    async def login(db: AsyncSession, email: str, password: str) -> LoginResponse:
+        user = await UserRepository.get_by_email(db, email)
+        if not user or not await verify_password_async(password, user.password):
             raise AppException(
                 error = "INVALID_CREDENTIALS",
                 message = "Email or password is incorrect.",
@@ -27,7 +34,7 @@ class AuthService:
         return LoginResponse(user = user, tokens = tokens)
     
     @staticmethod
-    def refresh_token(db: Session, refresh_token: str):
+    def _decode_refresh_token(refresh_token: str) -> dict:
         try:
             payload = decode_token(refresh_token)
         
@@ -44,8 +51,49 @@ class AuthService:
                 message = "User not found.", 
                 status_code = status.HTTP_401_UNAUTHORIZED
             )
+
+        if not payload.get("jti"):
+            raise AppException(
+                error = "INVALID_TOKEN", 
+                message = "Invalid refresh token",
+                status_code = status.HTTP_401_UNAUTHORIZED
+            )
+
+        if revocation_index.is_revoked(payload["jti"]):
+            raise AppException(
+                error = "TOKEN_REVOKED", 
+                message = "Refresh token has been revoked.",
+                status_code = status.HTTP_401_UNAUTHORIZED
+            )
+
+        return payload
+
+    @staticmethod
+    async def _revoke(db: AsyncSession, payload: dict) -> None:
+        try:
+            await RevokedTokenRepository.revoke(
+                db,
+                jti = payload["jti"],
+                user_id = int(payload["sub"]),
+                expires_at = datetime.fromtimestamp(payload["exp"], timezone.utc)
+            )
+        except IntegrityError:
+            # Another worker rotated or revoked this token first.
+            await db.rollback()
+            revocation_index.add(payload["jti"], payload["exp"])
+            raise AppException(
+                error = "TOKEN_REVOKED", 
+                message = "Refresh token has been revoked.",
+                status_code = status.HTTP_401_UNAUTHORIZED
+            )
+
+        on_commit(db, partial(revocation_index.add, payload["jti"], payload["exp"]))
+
+    @staticmethod
+    async def refresh_token(db: AsyncSession, refresh_token: str):
+        payload = AuthService._decode_refresh_token(refresh_token)
         
-        user = UserRepository.get_by_id(db, int(payload.get("sub")))
+        user = await UserService.get_cached(db, int(payload.get("sub")))
 
         if not user:
             raise AppException(
@@ -54,8 +102,16 @@ class AuthService:
                 status_code = status.HTTP_401_UNAUTHORIZED 
             )
         
+        await AuthService._revoke(db, payload)
+
         return TokenResponse(
             access_token = create_access_token(user.id, user.role),
-            refresh_token = refresh_token
+            refresh_token = create_refresh_token(user.id)
         )
+
+    @staticmethod
+    async def logout(db: AsyncSession, refresh_token: str) -> None:
+        payload = AuthService._decode_refresh_token(refresh_token)
+
+        await AuthService._revoke(db, payload)
     
\ No newline at end of file
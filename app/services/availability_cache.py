@@ -0,0 +1,92 @@
+import asyncio
+import os
+import time
+import uuid
+from typing import Awaitable, Callable, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.metrics import register_metrics
+from app.core.pg_listener import pg_listener
+from app.core.unit_of_work import on_commit
+
+CHANNEL = "available_motorcycles_changed"
+
+# Marks "nothing cached"; a cached None means the fleet is fully booked.
+_MISSING = object()
+
+class AvailableMotorcyclesCache:
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.remote_invalidations = 0
+        self._payload = _MISSING
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def _fresh(self):
+        if self._payload is not _MISSING and self._expires_at > time.monotonic():
+            return self._payload
+        return _MISSING
+
+    async def get_or_load(self, loader: Callable[[], Awaitable[Optional[bytes]]]) -> Optional[bytes]:
+        payload = self._fresh()
+        if payload is not _MISSING:
+            self.hits += 1
+            return payload
+
+        # Single flight: concurrent misses wait for one query instead of stampeding the DB.
+        async with self._lock:
+            payload = self._fresh()
+            if payload is not _MISSING:
+                self.hits += 1
+                return payload
+
+            self.misses += 1
+            generation = self._generation
+            payload = await loader()
+
+            # Do not keep a result that raced with an invalidation.
+            if generation == self._generation:
+                self._payload = payload
+                self._expires_at = time.monotonic() + self.ttl
+
+            return payload
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._payload = _MISSING
+        self.invalidations += 1
+
+    def on_notification(self, origin: Optional[str]) -> None:
+        if origin == self.origin:
+            return
+        self.remote_invalidations += 1
+        self.invalidate()
+
+    async def invalidate_on_commit(self, db: AsyncSession) -> None:
+        # NOTIFY is transactional: other workers hear it only if the write commits.
+        await db.execute(text("SELECT pg_notify(:channel, :origin)"), {"channel": CHANNEL, "origin": self.origin})
+        on_commit(db, self.invalidate)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "ttl_seconds": self.ttl,
+            "cached": self._fresh() is not _MISSING,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "remote_invalidations": self.remote_invalidations
+        }
+
+available_motorcycles_cache = AvailableMotorcyclesCache(ttl = settings.AVAILABLE_MOTORCYCLES_CACHE_TTL_SECONDS)
+
+pg_listener.subscribe(CHANNEL, available_motorcycles_cache.on_notification)
+register_metrics("available_motorcycles_cache", available_motorcycles_cache.stats)
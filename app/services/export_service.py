@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+from datetime import date
+from enum import Enum
+from typing import AsyncIterator, Optional
+from sqlalchemy.ext.asyncio import AsyncResult
+from app.core.config import settings
+from app.database import AsyncSessionLocal
+from app.repositories.motorcycle_repository import MotorcycleRepository
+from app.repositories.rental_repository import RentalRepository
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+async def _encode(result: AsyncResult, export_format: ExportFormat) -> AsyncIterator[str]:
+    columns = list(result.keys())
+
+    if export_format == ExportFormat.csv:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        # Sent on its own so an export with no rows still has its header.
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+        async for partition in result.partitions():
+            writer.writerows(partition)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        return
+
+    async for partition in result.partitions():
+        yield "".join(
+            json.dumps(dict(zip(columns, row)), default = str) + "\n" for row in partition
+        )
+
+class ExportService:
+
+    # Each export opens its own session: the response body is produced after the
+    # route returns, when the request-scoped session may already be closed.
+
+    @staticmethod
+    async def stream_rentals(export_format: ExportFormat, start_date_from: Optional[date], start_date_to: Optional[date]) -> AsyncIterator[str]:
+        async with AsyncSessionLocal() as db:
+            result = await RentalRepository.stream_for_export(
+                db, start_date_from, start_date_to, settings.EXPORT_BATCH_SIZE
+            )
+            async for chunk in _encode(result, export_format):
+                yield chunk
+
+    @staticmethod
+    async def stream_motorcycles(export_format: ExportFormat) -> AsyncIterator[str]:
+        async with AsyncSessionLocal() as db:
+            result = await MotorcycleRepository.stream_for_export(db, settings.EXPORT_BATCH_SIZE)
+            async for chunk in _encode(result, export_format):
+                yield chunk
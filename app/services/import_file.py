@@ -0,0 +1,40 @@
+import csv
+import io
+import json
+from typing import Optional
+from fastapi import status
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.services.export_service import ExportFormat
+
+def parse_import_file(content: bytes, data_format: ExportFormat) -> list[tuple[int, Optional[dict]]]:
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise AppException(
+            error = "INVALID_IMPORT_FILE",
+            message = "The import file must be UTF-8 encoded.",
+            status_code = status.HTTP_400_BAD_REQUEST
+        )
+
+    if data_format == ExportFormat.csv:
+        reader = csv.DictReader(io.StringIO(text))
+        records = [(reader.line_num, record) for record in reader]
+    else:
+        records = []
+        for line_num, line in enumerate(text.splitlines(), start = 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            records.append((line_num, record if isinstance(record, dict) else None))
+
+    if len(records) > settings.IMPORT_MAX_ROWS:
+        raise AppException(
+            error = "IMPORT_TOO_LARGE",
+            message = f"An import may contain at most {settings.IMPORT_MAX_ROWS} rows.",
+            status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        )
+    return records
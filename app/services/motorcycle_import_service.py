@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.events.motorcycle_events import motorcycle_created_event
+from app.repositories.motorcycle_repository import MotorcycleRepository
+from app.repositories.outbox_repository import OutboxRepository
+from app.schemas.motorcycle import MotorcycleImportError, MotorcycleImportReport
+from app.services.availability_cache import available_motorcycles_cache
+from app.services.export_service import ExportFormat
+from app.services.import_file import parse_import_file
+from app.services.motorcycle_service import VIN_LINE_REGEX
+
+def _valid_vin_rows(vins: list[str]) -> set[int]:
+    # One regex scan over all VINs joined by newlines instead of one match()
+    # call per row; VIN_LINE_REGEX anchors on line boundaries.
+    offsets, position = {}, 0
+    for index, vin in enumerate(vins):
+        offsets[position] = index
+        position += len(vin) + 1
+
+    return {offsets[match.start()] for match in VIN_LINE_REGEX.finditer("\n".join(vins))}
+
+class MotorcycleImportService:
+
+    @staticmethod
+    async def import_motorcycles(db: AsyncSession, content: bytes, data_format: ExportFormat) -> MotorcycleImportReport:
+        records = parse_import_file(content, data_format)
+
+        errors: list[MotorcycleImportError] = []
+
+        def reject(row: int, vin: Optional[str], error: str, message: str) -> None:
+            errors.append(MotorcycleImportError(row = row, vin = vin, error = error, message = message))
+
+        vins = [
+            str(record.get("vin") or "").strip().replace("\n", " ") if record else ""
+            for _, record in records
+        ]
+        valid_vins = _valid_vin_rows(vins)
+        max_year = datetime.now().year + 1
+
+        candidates: dict[str, tuple[int, dict]] = {}
+
+        for index, (row, record) in enumerate(records):
+            vin = vins[index] or None
+
+            if record is None:
+                reject(row, None, "INVALID_ROW", "The row could not be parsed.")
+                continue
+
+            model = str(record.get("model") or "").strip()
+            if not model or len(model) > 100:
+                reject(row, vin, "INVALID_MODEL", "Model is required and must have at most 100 characters.")
+                continue
+
+            try:
+                year = int(record.get("year"))
+            except (TypeError, ValueError):
+                year = None
+            if year is None or year < 1900 or year > max_year:
+                reject(row, vin, "INVALID_YEAR", "The year provided is not valid for a motorcycle.")
+                continue
+
+            if index not in valid_vins:
+                reject(row, vin, "INVALID_VIN_FORMAT", "The VIN format is invalid.")
+                continue
+
+            if vin in candidates:
+                reject(row, vin, "DUPLICATE_VIN", f"VIN already appears on row {candidates[vin][0]}.")
+                continue
+
+            candidates[vin] = (row, {"model": model, "year": year, "vin": vin})
+
+        created = []
+        values = [value for _, value in candidates.values()]
+
+        for start in range(0, len(values), settings.IMPORT_BATCH_SIZE):
+            created.extend(await MotorcycleRepository.insert_many(db, values[start:start + settings.IMPORT_BATCH_SIZE]))
+
+        inserted_vins = {motorcycle.vin for motorcycle in created}
+        for vin, (row, _) in candidates.items():
+            if vin not in inserted_vins:
+                reject(row, vin, "VIN_ALREADY_EXISTS", "A motorcycle with this VIN already exists.")
+
+        if created:
+            await available_motorcycles_cache.invalidate_on_commit(db)
+            await OutboxRepository.add_many(
+                db,
+                settings.KAFKA_MOTORCYCLE_TOPIC,
+                [(str(motorcycle.id), motorcycle_created_event(motorcycle)) for motorcycle in created]
+            )
+
+        errors.sort(key = lambda error: error.row)
+
+        return MotorcycleImportReport(
+            total = len(records),
+            imported = len(created),
+            failed = len(errors),
+            errors = errors
+        )
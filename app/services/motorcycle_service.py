@@ -1,14 +1,23 @@
 from fastapi import status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.motorcycle import MotorcycleCreate
 from app.models.motorcycle import Motorcycle
+from app.core.config import settings
 from app.core.exceptions import AppException
+from app.core.pagination import PageParams
+from app.repositories.motorcycle_repository import MotorcycleRepository
+from app.repositories.outbox_repository import OutboxRepository
 from datetime import datetime
 import re
-from app.core.kafka import KafkaProducer
+from typing import Optional
 from app.events.motorcycle_events import motorcycle_created_event
+from app.schemas.motorcycle import MotorcycleResponse
+from app.schemas.response import SucessResponse
+from app.services.availability_cache import available_motorcycles_cache
 
 VIN_REGEX = re.compile(r"^[A-Z]{3}-\d{4}$|^[A-Z]{3}\d[A-Z]\d{2}$")
+# Same pattern, matched line by line across many newline-joined VINs at once.
+VIN_LINE_REGEX = re.compile(VIN_REGEX.pattern, re.MULTILINE)
 
 class MotorcycleService:
 
@@ -31,8 +40,8 @@ class MotorcycleService:
             )
     
     @staticmethod
-    def _validate_unique_vin(db: Session, vin: str):
-        if MotorcycleRepository.get_by_vin(db, vin):
+    async def _validate_unique_vin(db: AsyncSession, vin: str):
+        if await MotorcycleRepository.get_by_vin(db, vin):
             raise AppException(
                 error = "VIN_ALREADY_EXISTS",
                 message = "A motorcycle with this VIN already exists.",
@@ -40,8 +49,8 @@ class MotorcycleService:
             )
 
     @staticmethod
-    def _validate_exists(db: Session, motorcycle_id: int) ->  Motorcycle:
-        motorcycle = MotorcycleRepository.get_by_id(db, motorcycle_id)
+    async def _validate_exists(db: AsyncSession, motorcycle_id: int) ->  Motorcycle:
+        motorcycle = await MotorcycleRepository.get_by_id(db, motorcycle_id)
         if not motorcycle:
             raise AppException(
                 error = "MOTORCYCLE_NOT_FOUND",
@@ -51,10 +60,10 @@ class MotorcycleService:
         return motorcycle
 
     @staticmethod
-    async def register(db: Session, payload: MotorcycleCreate) -> Motorcycle:
+    async def register(db: AsyncSession, payload: MotorcycleCreate) -> Motorcycle:
 
         MotorcycleService._validate_vin_format(payload.vin)
-        MotorcycleService._validate_unique_vin(db, payload.vin)
+        await MotorcycleService._validate_unique_vin(db, payload.vin)
         MotorcycleService._validate_year(payload.year)
 
         motorcycle = Motorcycle(
@@ -63,34 +72,52 @@ class MotorcycleService:
             vin = payload.vin
         )
 
-        motorcycle = MotorcycleRepository.create(db, motorcycle)
+        await available_motorcycles_cache.invalidate_on_commit(db)
+        motorcycle = await MotorcycleRepository.create(db, motorcycle)
 
-        await KafkaProducer.send(
-            topic = "motorcycle.created",
-            message = motorcycle_created_event(motorcycle)
+        # Written in the same transaction as the motorcycle; the outbox relay publishes it.
+        await OutboxRepository.add(
+            db,
+            settings.KAFKA_MOTORCYCLE_TOPIC,
+            motorcycle_created_event(motorcycle),
+            key = str(motorcycle.id)
         )
 
         return motorcycle
 
     @staticmethod
-    def list_all(db: Session):
-        return MotorcycleRepository.list_all(db)
+    async def list_all(db: AsyncSession, page: PageParams):
+        return await MotorcycleRepository.list_all(db, page.after_id, page.limit)
     
     @staticmethod
-    def list_available(db: Session): 
-        motorcycles = MotorcycleRepository.list_available(db)
+    async def list_available_payload(db: AsyncSession) -> bytes:
 
-        if not motorcycles:
+        async def load() -> Optional[bytes]:
+            motorcycles = await MotorcycleRepository.list_available(db)
+
+            # An empty fleet is cached too (as None), so a fully booked fleet
+            # does not send every request to the database.
+            if not motorcycles:
+                return None
+
+            return SucessResponse(
+                message = "Available motorcycles retrieved successfully.",
+                data = [MotorcycleResponse.model_validate(m) for m in motorcycles]
+            ).model_dump_json().encode()
+
+        payload = await available_motorcycles_cache.get_or_load(load)
+
+        if payload is None:
             raise AppException(
                 error = "NO_AVAILABLE_MOTORCYCLES",
                 message = "There are no available motorcycles at the moment.",
                 status_code = status.HTTP_404_NOT_FOUND
             )
-        return motorcycles
+        return payload
     
     @staticmethod
-    def get_by_vin(db: Session, vin: int) -> Motorcycle:
-        motorcycle = MotorcycleRepository.get_by_vin(db, vin)
+    async def get_by_vin(db: AsyncSession, vin: int) -> Motorcycle:
+        motorcycle = await MotorcycleRepository.get_by_vin(db, vin)
 
         if not motorcycle:
             raise AppException(
@@ -101,8 +128,8 @@ class MotorcycleService:
         return motorcycle
 
     @staticmethod
-    def update_vin(db: Session, motorcycle_id: int, new_vin: str) -> Motorcycle:
-        motorcycle = MotorcycleService._validate_exists(db, motorcycle_id)
+    async def update_vin(db: AsyncSession, motorcycle_id: int, new_vin: str) -> Motorcycle:
+        motorcycle = await MotorcycleService._validate_exists(db, motorcycle_id)
         
         if motorcycle.vin == new_vin:
             raise AppException(
@@ -113,20 +140,22 @@ class MotorcycleService:
         
 
         MotorcycleService._validate_vin_format(new_vin)
-        MotorcycleService._validate_unique_vin(db, new_vin)
+        await MotorcycleService._validate_unique_vin(db, new_vin)
 
-        return MotorcycleRepository.update_vin(db, motorcycle, new_vin)
+        await available_motorcycles_cache.invalidate_on_commit(db)
+        return await MotorcycleRepository.update_vin(db, motorcycle, new_vin)
 
-    def delete(db: Session, motorcycle_id: int) -> None:
-        motorcycle = MotorcycleService._validate_exists(db, motorcycle_id)
+    async def delete(db: AsyncSession, motorcycle_id: int) -> None:
+        motorcycle = await MotorcycleService._validate_exists(db, motorcycle_id)
         
-        if MotorcycleRepository.has_rentals(db, motorcycle_id):
+        if await MotorcycleRepository.has_rentals(db, motorcycle_id):
             raise AppException(
                 error = "MOTORCYCLE_HAS_RENTALS",
                 message = "Motorcycle cannot be removed because it has rental records.",
                 status_code = status.HTTP_409_CONFLICT
             )
 
-        MotorcycleRepository.delete(db, motorcycle)
+        await available_motorcycles_cache.invalidate_on_commit(db)
+        await MotorcycleRepository.delete(db, motorcycle)
 
     
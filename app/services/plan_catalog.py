@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.metrics import register_metrics
+from app.core.pg_listener import pg_listener
+from app.core.unit_of_work import on_commit
+from app.database import AsyncSessionLocal
+from app.repositories.rental_plan_repository import RentalPlanRepository
+from app.schemas.rental_plan import RentalPlanResponse
+from app.schemas.response import SucessResponse
+
+logger = logging.getLogger("plan_catalog")
+
+CHANNEL = "rental_plans_changed"
+
+@dataclass(frozen = True)
+class CatalogPlan:
+    id: int
+    days: int
+    price_per_day: Decimal
+
+
+@dataclass(frozen = True)
+class PlanCatalogSnapshot:
+    plans: Mapping[int, CatalogPlan]
+    version: str
+    payload: bytes
+
+    @classmethod
+    def build(cls, plans: Iterable[CatalogPlan]) -> "PlanCatalogSnapshot":
+        ordered = sorted(plans, key = lambda plan: plan.days)
+        payload = SucessResponse(
+            message = "Rental plans retrieved successfully.",
+            data = [RentalPlanResponse.model_validate(plan) for plan in ordered]
+        ).model_dump_json().encode()
+
+        return cls(
+            plans = MappingProxyType({plan.days: plan for plan in ordered}),
+            version = hashlib.sha256(payload).hexdigest()[:16],
+            payload = payload
+        )
+
+
+class RentalPlanCatalog:
+
+    # Rental plans change about once a year, so lookups read an immutable
+    # snapshot that is swapped as a whole whenever the table changes.
+    def __init__(self):
+        self.reloads = 0
+        self.failed_reloads = 0
+        self._snapshot = PlanCatalogSnapshot.build(())
+        self._lock = asyncio.Lock()
+        self._pending: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> PlanCatalogSnapshot:
+        return self._snapshot
+
+    def get(self, days: int) -> Optional[CatalogPlan]:
+        return self._snapshot.plans.get(days)
+
+    async def reload(self) -> None:
+        async with self._lock:
+            async with AsyncSessionLocal() as db:
+                plans = await RentalPlanRepository.list_all(db)
+
+            self._snapshot = PlanCatalogSnapshot.build(
+                CatalogPlan(id = plan.id, days = plan.days, price_per_day = plan.price_per_day) for plan in plans
+            )
+            self.reloads += 1
+
+    async def _reload_in_background(self) -> None:
+        try:
+            await self.reload()
+        except Exception as e:
+            # Keep serving the previous snapshot; the next notification retries.
+            self.failed_reloads += 1
+            logger.warning("Rental plan catalog reload failed: %s", e)
+
+    def on_notification(self, payload: Optional[str]) -> None:
+        self._pending = asyncio.get_running_loop().create_task(self._reload_in_background())
+
+    async def reload_on_commit(self, db: AsyncSession) -> None:
+        await db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": CHANNEL})
+        on_commit(db, self.reload)
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version,
+            "plans": len(snapshot.plans),
+            "reloads": self.reloads,
+            "failed_reloads": self.failed_reloads
+        }
+
+rental_plan_catalog = RentalPlanCatalog()
+
+pg_listener.subscribe(CHANNEL, rental_plan_catalog.on_notification)
+register_metrics("rental_plan_catalog", rental_plan_catalog.stats)
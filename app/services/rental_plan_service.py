@@ -1,14 +1,16 @@
+from decimal import Decimal
 from fastapi import status 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import AppException
 from app.repositories.rental_plan_repository import RentalPlanRepository
 from app.models.rental_plan import RentalPlan
+from app.services.plan_catalog import CatalogPlan, PlanCatalogSnapshot, rental_plan_catalog
 
 class RentalPlanService:
 
     @staticmethod
-    def get_by_days(db: Session, days: int) -> RentalPlan:
-        plan = RentalPlanRepository.get_by_days(db, days)
+    def get_by_days(days: int) -> CatalogPlan:
+        plan = rental_plan_catalog.get(days)
 
         if not plan:
             raise AppException(
@@ -16,4 +18,14 @@ class RentalPlanService:
                 message = "Rental plan not found",
                 status_code = status.HTTP_404_NOT_FOUND
             )
-        return plan
\ No newline at end of file
+        return plan
+
+    @staticmethod
+    def catalog() -> PlanCatalogSnapshot:
+        return rental_plan_catalog.snapshot
+
+    @staticmethod
+    async def set_price(db: AsyncSession, days: int, price_per_day: Decimal) -> RentalPlan:
+        plan = await RentalPlanRepository.upsert(db, days, price_per_day)
+        await rental_plan_catalog.reload_on_commit(db)
+        return plan
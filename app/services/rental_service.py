@@ -1,61 +1,51 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import status
+from app.core.db_errors import constraint_name
 from app.core.exceptions import AppException
+from app.core.pagination import PageParams
 from app.models.rental import Rental 
-from app.repositories.rental_plan_repository import RentalPlanRepository
 from app.services.rental_plan_service import RentalPlanService
 from app.repositories.rental_repository import RentalRepository
-from app.repositories.motorcycle_repository import MotorcycleRepository
 from datetime import date
-from app.repositories.user_repository import UserRepository
 from app.schemas.rental import RentalReturnResponse
+from app.services.availability_cache import available_motorcycles_cache
 
 class RentalService:
 
     @staticmethod
-    def _validate_user(db: Session, user_id: int):
-        if not UserRepository.get_by_id(db, user_id):
+    def _already_rented() -> AppException:
+        return AppException(
+            error = "MOTORCYCLE_ALREADY_RENTED", 
+            message = "Motorcycle is already rented.",
+            status_code = status.HTTP_409_CONFLICT,
+        )
+
+    @staticmethod
+    def _validate_booking_context(context) -> None:
+        if context is None:
             raise AppException(
                 error = "USER_NOT_FOUND",
                 message = "User not found.",
                 status_code = status.HTTP_404_NOT_FOUND,
             ) 
 
-    @staticmethod   
-    def _validate_motorcycle(db: Session, motorcycle_id: int):
-        if not MotorcycleRepository.get_by_id(db, motorcycle_id):
+        if "A" not in (context.cnh_type or ""):
             raise AppException(
-                error = "MOTORCYCLE_NOT_FOUND", 
-                message = "Motorcycle not found.",
-                status_code = status.HTTP_404_NOT_FOUND,
+                error = "INVALID_CNH_TYPE",
+                message = "User does not have a valid motorcycle driver's license (CNH A).",
+                status_code = status.HTTP_403_FORBIDDEN
             )
 
-    @staticmethod
-    def _validate_motorcycle_availability(db: Session, motorcycle_id: int):
-        if RentalRepository.has_active_rental(db, motorcycle_id):
+        if context.motorcycle_id is None:
             raise AppException(
-                error = "MOTORCYCLE_ALREADY_RENTED", 
-                message = "Motorcycle is already rented.",
-                status_code = status.HTTP_409_CONFLICT,
-            )
-        
-    @staticmethod
-    def _validate_license(db: Session, user_id: int):
-        user = UserRepository.get_by_id(db, user_id)
-        
-        if not user:
-            raise AppException(
-                error = "USER_NOT_FOUND",
-                message = "User not found",
-                status_code = status.HTTP_404_NOT_FOUND 
+                error = "MOTORCYCLE_NOT_FOUND", 
+                message = "Motorcycle not found.",
+                status_code = status.HTTP_404_NOT_FOUND,
             )
 
-        if "A" not in (user.cnh_type):
-            raise AppException(
-                error = "INVALID_CNH_TYPE",
-                message = "User does not have a valid motorcycle driver's license (CNH A).",
-                status_code = status.HTTP_403_FORBIDDEN
-            )
+        if not context.is_available:
+            raise RentalService._already_rented()
 
     @staticmethod
     def _validate_start_date(start_date: date):
@@ -67,22 +57,14 @@ class RentalService:
             )
         
     @staticmethod
-    def register(db: Session, user_id: int, data) -> Rental:
+    async def register(db: AsyncSession, user_id: int, data) -> Rental:
+
+        context = await RentalRepository.get_booking_context(db, user_id, data.motorcycle_id)
 
-        RentalService._validate_user(db, user_id)
-        RentalService._validate_license(db, user_id)
-        RentalService._validate_motorcycle(db, data.motorcycle_id)
-        RentalService._validate_motorcycle_availability(db, data.motorcycle_id)
+        RentalService._validate_booking_context(context)
         RentalService._validate_start_date(data.start_date)
 
-        plan = RentalPlanRepository.get_by_days(db, data.plan_days)
-
-        if not plan:
-            raise AppException(
-                error = "RENTAL_PLAN_NOT_FOUND",
-                message = "Rental plan not found",
-                status_code = status.HTTP_404_NOT_FOUND
-            )
+        plan = RentalPlanService.get_by_days(data.plan_days)
 
         if (data.expected_end_date - data.start_date).days != plan.days:
             raise AppException(
@@ -99,17 +81,31 @@ class RentalService:
             end_date = None,
             status = "active"
         )
-        return RentalRepository.create(db, rental)
+
+        await available_motorcycles_cache.invalidate_on_commit(db)
+
+        # The availability flag read above can be stale by now; the unique
+        # partial index on active rentals is what settles concurrent bookings.
+        try:
+            rental = await RentalRepository.create(db, rental)
+        except IntegrityError as e:
+            await db.rollback()
+
+            if constraint_name(e) == "uq_rentals_active_motorcycle_id":
+                raise RentalService._already_rented()
+            raise
+
+        return rental
 
     @staticmethod
-    def list_all(db: Session) -> list[Rental]:
-        return RentalRepository.list_all(db)
+    async def list_all(db: AsyncSession, page: PageParams) -> list[Rental]:
+        return await RentalRepository.list_all(db, page.after_id, page.limit)
 
     @staticmethod
-    def list_by_motorcycle(db: Session, motorcycle_id: int) -> list[Rental]:
-        rentals = RentalRepository.list_by_motorcycle(db, motorcycle_id)
+    async def list_by_motorcycle(db: AsyncSession, motorcycle_id: int, page: PageParams) -> list[Rental]:
+        rentals = await RentalRepository.list_by_motorcycle(db, motorcycle_id, page.after_id, page.limit)
 
-        if not rentals:
+        if not rentals and page.after_id is None:
             raise AppException(
                 error = "RENTALS_NOT_FOUND",
                 message = "No rentals found for this motorcycle.",
@@ -118,12 +114,12 @@ class RentalService:
         return rentals
 
     @staticmethod
-    def list_by_user(db: Session, user_id: int) -> list[Rental]:
-        return RentalRepository.list_by_user(db, user_id)
+    async def list_by_user(db: AsyncSession, user_id: int, page: PageParams) -> list[Rental]:
+        return await RentalRepository.list_by_user(db, user_id, page.after_id, page.limit)
     
     @staticmethod
-    def _validate_rental(db: Session, rental_id: int) -> Rental:
-        rental = RentalRepository.get_by_id(db, rental_id)
+    async def _validate_rental(db: AsyncSession, rental_id: int) -> Rental:
+        rental = await RentalRepository.get_by_id(db, rental_id)
 
         if not rental:
             raise AppException(
@@ -143,9 +139,9 @@ class RentalService:
             )
 
     @staticmethod
-    def return_rental(db: Session, rental_id: int, user_id:int, return_date: date) -> RentalReturnResponse:
+    async def return_rental(db: AsyncSession, rental_id: int, user_id:int, return_date: date) -> RentalReturnResponse:
 
-        rental = RentalService._validate_rental(db, rental_id)
+        rental = await RentalService._validate_rental(db, rental_id)
         RentalService._validate_rental_ownership(rental, user_id)
 
         if rental.status != "active":
@@ -156,7 +152,7 @@ class RentalService:
             )
         
         plan_days = (rental.expected_end_date - rental.start_date).days
-        plan = RentalPlanService.get_by_days(db, plan_days)
+        plan = RentalPlanService.get_by_days(plan_days)
 
         price_per_day = float(plan.price_per_day)
         base_amount = plan_days * price_per_day
@@ -185,7 +181,9 @@ class RentalService:
 
         rental.end_date = return_date
         rental.status = "finished"
-        RentalRepository.finished(db, rental)
+
+        await available_motorcycles_cache.invalidate_on_commit(db)
+        await RentalRepository.finished(db, rental)
 
         return RentalReturnResponse(
             rental_id = rental.id,
@@ -0,0 +1,127 @@
+import json
+from typing import AsyncIterator, Optional
+from pydantic import ValidationError
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.core.security import bulk_password_hasher
+from app.core.unit_of_work import UnitOfWork
+from app.repositories.user_repository import UserRepository
+from app.schemas.user import UserCreate
+from app.services.user_service import UserService
+
+# Unique user fields, in the order conflicts are reported, with the error
+# code for a duplicate inside the file and for a value already registered.
+UNIQUE_FIELDS = (
+    ("email", "DUPLICATE_EMAIL", "EMAIL_ALREADY_EXISTS"),
+    ("cnpj", "DUPLICATE_CNPJ", "CNPJ_ALREADY_EXISTS"),
+    ("cnh_number", "DUPLICATE_CNH", "CNH_ALREADY_EXISTS"),
+)
+
+def _result(row: int, email: Optional[str], **fields) -> str:
+    return json.dumps({"row": row, "email": email, **fields}) + "\n"
+
+def _error(row: int, email: Optional[str], error: str, message: str) -> str:
+    return _result(row, email, status = "error", error = error, message = message)
+
+class UserImportService:
+
+    # Streams one NDJSON result per record. Each batch is its own transaction,
+    # so a "created" line is only emitted once that rider is committed.
+
+    @staticmethod
+    async def import_users(records: list[tuple[int, Optional[dict]]]) -> AsyncIterator[str]:
+        seen = {field: {} for field, _, _ in UNIQUE_FIELDS}
+
+        for start in range(0, len(records), settings.IMPORT_BATCH_SIZE):
+            lines: list[tuple[int, str]] = []
+            candidates: list[tuple[int, UserCreate]] = []
+
+            for row, record in records[start:start + settings.IMPORT_BATCH_SIZE]:
+                email = record.get("email") if record else None
+
+                if record is None:
+                    lines.append((row, _error(row, None, "INVALID_ROW", "The row could not be parsed.")))
+                    continue
+
+                try:
+                    user = UserCreate.model_validate(record)
+                    UserService._validate_cnh_type(user.cnh_type)
+                except ValidationError as e:
+                    message = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+                    lines.append((row, _error(row, email, "VALIDATION_ERROR", message)))
+                    continue
+                except AppException as e:
+                    lines.append((row, _error(row, email, e.error, e.message)))
+                    continue
+
+                duplicate = next(
+                    ((field, code) for field, code, _ in UNIQUE_FIELDS if getattr(user, field) in seen[field]),
+                    None
+                )
+                if duplicate:
+                    field, code = duplicate
+                    first_row = seen[field][getattr(user, field)]
+                    lines.append((row, _error(row, email, code, f"Same {field} as row {first_row}.")))
+                    continue
+
+                for field, _, _ in UNIQUE_FIELDS:
+                    seen[field][getattr(user, field)] = row
+                candidates.append((row, user))
+
+            async with UnitOfWork() as uow:
+                candidates = await UserImportService._reject_existing(uow, candidates, lines)
+
+                if candidates:
+                    hashes = await bulk_password_hasher.hash_many([user.password for _, user in candidates])
+                    created = {
+                        r.email: r.id for r in await UserRepository.insert_many(uow.session, [
+                            {
+                                "name": user.name,
+                                "email": user.email,
+                                "password": hashed,
+                                "role": "user",
+                                "cnpj": user.cnpj,
+                                "birthday": user.birthday.isoformat(),
+                                "cnh_number": user.cnh_number,
+                                "cnh_type": user.cnh_type
+                            }
+                            for (_, user), hashed in zip(candidates, hashes)
+                        ])
+                    }
+                    await uow.commit()
+
+                    for row, user in candidates:
+                        if user.email in created:
+                            lines.append((row, _result(row, user.email, status = "created", id = created[user.email])))
+                        else:
+                            # Registered concurrently between the lookup and the insert.
+                            lines.append((row, _error(row, user.email, "USER_ALREADY_EXISTS", "A conflicting user was registered concurrently.")))
+
+            if lines:
+                lines.sort(key = lambda line: line[0])
+                yield "".join(line for _, line in lines)
+
+    @staticmethod
+    async def _reject_existing(uow: UnitOfWork, candidates: list[tuple[int, UserCreate]], lines: list[tuple[int, str]]) -> list[tuple[int, UserCreate]]:
+        if not candidates:
+            return candidates
+
+        # One lookup per batch, before any password is hashed.
+        existing = await UserRepository.find_existing(
+            uow.session,
+            [user.email for _, user in candidates],
+            [user.cnpj for _, user in candidates],
+            [user.cnh_number for _, user in candidates]
+        )
+        taken = {field: {getattr(r, field) for r in existing} for field, _, _ in UNIQUE_FIELDS}
+        messages = {code: message for code, message in UserService.UNIQUE_CONFLICTS.values()}
+
+        remaining = []
+        for row, user in candidates:
+            conflict = next((code for field, _, code in UNIQUE_FIELDS if getattr(user, field) in taken[field]), None)
+
+            if conflict:
+                lines.append((row, _error(row, user.email, conflict, messages[conflict])))
+            else:
+                remaining.append((row, user))
+        return remaining
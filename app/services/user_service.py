@@ -1,39 +1,43 @@
+from typing import Optional
 from fastapi import status, UploadFile
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.user import UserCreate, AdminCreate
 from app.models.user import User
-from app.core.security import hash_password
+from app.core.security import hash_password, hash_password_async
 from app.repositories.user_repository import UserRepository
+from app.core.db_errors import constraint_name
 from app.core.exceptions import AppException
+from app.core.user_cache import CachedUser, user_cache
 from app.services.cnh_photo_service import CNHPhotoService
 
 VALID_CNH_TYPES = {"A", "B", "AB"}
 class UserService:
 
-    @staticmethod
-    def _validate_email(db: Session, email: str):
-        if UserRepository.get_by_email(db, email):
-            raise AppException(
-                error = "EMAIL_ALREADY_EXISTS",
-                message = "A user with this email already exists.",
-                status_code = status.HTTP_409_CONFLICT
-            )
+    # Unique indexes on users and the conflict each one reports. Registration
+    # inserts first and lets Postgres decide, so there is no racy pre-check.
+    UNIQUE_CONFLICTS = {
+        "ix_users_email": ("EMAIL_ALREADY_EXISTS", "A user with this email already exists."),
+        "ix_users_cnpj": ("CNPJ_ALREADY_EXISTS", "A user with this CNPJ already exists."),
+        "ix_users_cnh_number": ("CNH_ALREADY_EXISTS", "A user with this CNH number already exists."),
+    }
 
-    @staticmethod
-    def _validate_cnpj(db: Session, cnpj: str):
-        if UserRepository.get_by_cnpj(db, cnpj):
-            raise AppException(
-                error = "EMAIL_ALREADY_EXISTS",
-                message = "A user with this CNPJ already exists.",
-                status_code = status.HTTP_409_CONFLICT
-            )
+    @classmethod
+    async def _create(cls, db: AsyncSession, user: User) -> User:
+        try:
+            return await UserRepository.create(db, user)
+        except IntegrityError as e:
+            await db.rollback()
+            conflict = cls.UNIQUE_CONFLICTS.get(constraint_name(e))
 
-    @staticmethod
-    def _validate_cnh(db: Session, cnh_number: str):
-        if UserRepository.get_by_cnh(db, cnh_number):
+            if conflict is None:
+                raise
+
+            error, message = conflict
             raise AppException(
-                error = "EMAIL_ALREADY_EXISTS",
-                message = "A user with this CNH number already exists.",
+                error = error,
+                message = message,
                 status_code = status.HTTP_409_CONFLICT
             )
 
@@ -47,51 +51,72 @@ class UserService:
             )
 
     @classmethod   
-    def register_user(cls, db: Session, user: UserCreate) -> User:
+    async def register_user(cls, db: AsyncSession, user: UserCreate) -> User:
 
-        cls._validate_email(db, user.email)
-        cls._validate_cnpj(db, user.cnpj)
-        cls._validate_cnh(db, user.cnh_number)
         cls._validate_cnh_type(user.cnh_type)
 
         new_user = User(
             name = user.name,
             email = user.email,
-            password = hash_password(user.password), 
+            password = await hash_password_async(user.password), 
             role = "user", 
             cnpj = user.cnpj,
-            birthday = user.birthday,
+            # users.birthday is a text column; asyncpg will not coerce a date into it.
+            birthday = user.birthday.isoformat(),
             cnh_number = user.cnh_number,
             cnh_type = user.cnh_type
         )
 
-        return UserRepository.create(db, new_user)
+        return await cls._create(db, new_user)
 
     @classmethod
-    def register_admin(cls, db: Session, user: AdminCreate) -> User:
-
-        cls._validate_email(db, user.email)
+    async def register_admin(cls, db: AsyncSession, user: AdminCreate) -> User:
 
         new_admin = User(
             name = user.name,
             email = user.email,
-            password = hash_password(user.password),
+            password = await hash_password_async(user.password),
             role = "admin"
         )
 
-        return UserRepository.create(db, new_admin)
+        return await cls._create(db, new_admin)
     
     @staticmethod
-    def upload_cnh_photo(db: Session, user: User, file: UploadFile) -> User:
-        photo_path = CNHPhotoService.upload(user_id = user.id, file = file)
+    async def get_cached(db: AsyncSession, user_id: int) -> Optional[CachedUser]:
+        user = user_cache.get(user_id)
+
+        if user is not None:
+            return user
+
+        db_user = await UserRepository.get_by_id(db, user_id)
+
+        if not db_user:
+            return None
+
+        user = CachedUser.from_model(db_user)
+        user_cache.set(user.id, user)
+        return user
+
+    @staticmethod
+    async def upload_cnh_photo(db: AsyncSession, user_id: int, file: UploadFile) -> User:
+        user = await UserRepository.get_by_id(db, user_id)
+
+        if not user:
+            raise AppException(
+                error = "USER_NOT_FOUND",
+                message = "User not found.",
+                status_code = status.HTTP_401_UNAUTHORIZED
+            )
+
+        photo_path = await run_in_threadpool(CNHPhotoService.upload, user_id = user.id, file = file)
 
-        return UserRepository.update_cnh_photo(db, user, photo_path)
+        return await UserRepository.update_cnh_photo(db, user, photo_path)
     
     @staticmethod
-    def create_admin_if_not_exists(db: Session) -> None:
+    async def create_admin_if_not_exists(db: AsyncSession) -> None:
         admin_email  = "admin@example.com"
 
-        admin = UserRepository.get_by_email(db, admin_email)
+        admin = await UserRepository.get_by_email(db, admin_email)
         if admin:
             return 
         
@@ -101,6 +126,6 @@ class UserService:
             role = "ADMIN"
         )
 
-        UserRepository.create(db, admin_user)
+        await UserRepository.create(db, admin_user)
 
         
\ No newline at end of file